@@ -1,4 +1,4 @@
-from pathlib import Path
+import os
 import time
 from shared.settings import settings
 import logging
@@ -11,28 +11,31 @@ logger = logging.getLogger(__name__)
 # it is scheduled in the download router
 
 
+def _cleanup_directory(directory: str, cutoff: float):
+	"""Remove files older than cutoff below directory, then remove emptied subdirectories (bottom-up)"""
+	with os.scandir(directory) as entries:
+		for entry in entries:
+			if entry.is_dir(follow_symlinks=False):
+				_cleanup_directory(entry.path, cutoff)
+				try:
+					os.rmdir(entry.path)  # Only removes if directory is empty
+					logger.info(f'Removed empty directory: {entry.path}')
+				except OSError:
+					pass  # Directory not empty, skip
+			elif entry.is_file() and entry.stat().st_mtime < cutoff:
+				try:
+					os.unlink(entry.path)
+					logger.info(f'Removed old download file: {entry.path}')
+				except Exception as e:
+					logger.error(f'Failed to remove old download file {entry.path}: {e}')
+
+
 @test_environment_only
 def cleanup_downloads_directory(max_age_hours: int = 1):
 	"""Remove files older than max_age_hours from downloads directory"""
 	downloads_dir = settings.downloads_path
-	current_time = time.time()
-
-	# First pass: remove old files
-	for item in downloads_dir.glob('**/*'):
-		if item.is_file():
-			file_age = current_time - item.stat().st_mtime
-			if file_age > (max_age_hours * 3600):
-				try:
-					item.unlink()
-					logger.info(f'Removed old download file: {item}')
-				except Exception as e:
-					logger.error(f'Failed to remove old download file {item}: {e}')
+	cutoff = time.time() - max_age_hours * 3600
 
-	# Second pass: remove empty directories
-	for item in downloads_dir.glob('**/*'):
-		if item.is_dir():
-			try:
-				item.rmdir()  # Only removes if directory is empty
-				logger.info(f'Removed empty directory: {item}')
-			except OSError:
-				pass  # Directory not empty, skip
+	# os.scandir yields the file type with each entry, so a single walk removes old files
+	# and empty directories with one stat per file instead of is_file() + stat() per path
+	_cleanup_directory(downloads_dir, cutoff)
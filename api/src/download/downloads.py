@@ -13,7 +13,7 @@ import pandas as pd
 from shared.logging import UnifiedLogger
 from shared.settings import settings
 from shared.db import use_client
-from shared.models import Label, Dataset, LicenseEnum, Ortho, LabelDataEnum, LabelSourceEnum
+from shared.models import Label, LabelListAdapter, Dataset, LicenseEnum, Ortho, LabelDataEnum, LabelSourceEnum
 from shared.labels import get_model_preferences
 
 TEMPLATE_PATH = Path(__file__).parent / 'templates'
@@ -503,7 +503,7 @@ def get_all_dataset_labels(dataset_id: int) -> List[Label]:
 			return []
 
 		logger.info(f'Successfully fetched {len(all_labels)} labels for dataset {dataset_id}')
-		return [Label(**label_data) for label_data in all_labels]
+		return LabelListAdapter.validate_python(all_labels)
 
 
 def filter_exportable_dataset_labels(
@@ -185,6 +185,7 @@ def create_processing_task(
 				.select('id')
 				.eq('dataset_id', dataset_id)
 				.eq('is_processing', True)
+				.limit(1)
 				.execute()
 			)
 			if active_queue.data:
@@ -320,13 +321,13 @@ def create_processing_task(
 	# instead of inserting a duplicate task.
 	def _task_already_inserted() -> bool:
 		with use_client(token) as client:
-			existing = client.table(settings.queue_table).select('id').eq('dataset_id', dataset_id).execute()
+			existing = client.table(settings.queue_table).select('id').eq('dataset_id', dataset_id).limit(1).execute()
 			return bool(existing.data)
 
 	@retry_on_transient_error(verify_succeeded=_task_already_inserted)
 	def _insert_task() -> Optional[dict]:
 		with use_client(token) as client:
-			send_data = {k: v for k, v in payload.model_dump().items() if v is not None and k != 'id'}
+			send_data = payload.model_dump(exclude={'id'}, exclude_none=True)
 			response = client.table(settings.queue_table).insert(send_data).execute()
 			return response.data[0]
 
@@ -593,7 +594,7 @@ def create_processing_task(
 # 		)
 
 # 		with use_client(token) as client:
-# 			send_data = {k: v for k, v in payload.model_dump().items() if v is not None and k != 'id'}
+# 			send_data = payload.model_dump(exclude={'id'}, exclude_none=True)
 # 			response = client.table(settings.queue_table).insert(send_data).execute()
 # 			payload = TaskPayload(**response.data[0])
 # 	except Exception as e:
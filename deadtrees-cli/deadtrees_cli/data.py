@@ -305,13 +305,13 @@ class DataCommands:
 		label_data: str,
 		label_quality: int,
 		properties: Optional[Dict[str, Any]] = None,
-		labels_layer: str = 'labels',
+		labels_layer: Optional[str] = 'labels',
 		aoi_layer: Optional[str] = 'aoi',
 		aoi_image_quality: Optional[int] = None,
 		aoi_notes: Optional[str] = None,
 	) -> Label:
 		"""Upload a label from a GeoPackage file"""
-		# Read labels layer
+		# Read labels layer (None reads the first layer in the GeoPackage)
 		labels_gdf = gpd.read_file(gpkg_path, layer=labels_layer).to_crs(epsg=4326)
 
 		# Read AOI layer if specified
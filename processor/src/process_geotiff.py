@@ -9,7 +9,7 @@ from shared.logger import logger
 from shared.ortho import upsert_processed_ortho_entry, upsert_ortho_entry
 from .utils.ssh import pull_file_from_storage_server, push_file_to_storage_server
 from .exceptions import AuthenticationError, DatasetError, ProcessingError, ConversionError
-from .geotiff.standardise_geotiff import standardise_geotiff, verify_geotiff
+from .geotiff.standardise_geotiff import standardise_geotiff
 from rio_cogeo.cogeo import cog_info
 from shared.hash import get_file_identifier
 from shared.logging import LogContext, LogCategory
@@ -178,20 +178,10 @@ def process_geotiff(task: QueueTask, temp_dir: Path):
 			# Re-raise with the specific reason from ConversionError
 			raise ProcessingError(e.reason, task_type='convert', task_id=task.id, dataset_id=ortho.dataset_id)
 
-		# Verify converted file
-		logger.info(
-			'Verifying converted GeoTIFF',
-			LogContext(category=LogCategory.ORTHO, dataset_id=task.dataset_id, user_id=user.id, token=token),
-		)
-		if not verify_geotiff(str(path_converted), token, task.dataset_id):
-			raise ProcessingError(
-				'Converted file verification failed', task_type='convert', task_id=task.id, dataset_id=ortho.dataset_id
-			)
-
 		t2 = time.time()
 		ortho_processing_runtime = t2 - t1
 
-		# If verification successful, replace original file on storage server
+		# Replace original file on storage server
 		logger.info(
 			'Pushing converted file to storage server',
 			LogContext(category=LogCategory.ORTHO, dataset_id=task.dataset_id, user_id=user.id, token=token),
@@ -11,7 +11,7 @@ from typing import Optional
 from supabase import create_client
 from shared.settings import settings
 from shared.db import use_client
-from shared.logging import LogContext, LogCategory, UnifiedLogger, SupabaseHandler
+from shared.logging import LogContext, LogCategory, UnifiedLogger, SupabaseHandler, supabase_log_writer
 from shared.models import TaskTypeEnum
 
 # Initialize logger with database persistence
@@ -130,6 +130,8 @@ def get_dataset_context(token: str, dataset_id: int) -> dict:
 
 def get_recent_error_logs(token: str, dataset_id: int, limit: int = 10) -> list[str]:
 	"""Get recent error logs for a dataset."""
+	# Make sure errors logged just before this call have reached v2_logs
+	supabase_log_writer.flush()
 	try:
 		with use_client(token) as client:
 			response = client.table(settings.logs_table).select(
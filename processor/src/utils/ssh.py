@@ -1,7 +1,10 @@
 import os
+import threading
 import paramiko
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
+from typing import Generator, Optional
 from shared.logger import logger
 from shared.settings import settings
 from shared.testing.safety import test_environment_only
@@ -23,23 +26,23 @@ def _connect_with_retry(ssh: paramiko.SSHClient, **connect_kwargs) -> None:
 	ssh.connect(**connect_kwargs)
 
 
-def pull_file_from_storage_server(remote_file_path: str, local_file_path: str, token: str, dataset_id: int):
-	# Check if the file already exists locally
-	if os.path.exists(local_file_path):
-		logger.info(
-			f'File already exists locally at: {local_file_path}',
-			LogContext(category=LogCategory.SSH, token=token, dataset_id=dataset_id),
-		)
-		return
+# A single authenticated connection to the storage server is shared by all transfers of
+# this process, so a task pays the SSH handshake (key exchange + auth) once instead of per file.
+SSH_KEEPALIVE_INTERVAL = 30
+_storage_ssh: Optional[paramiko.SSHClient] = None
+_storage_ssh_lock = threading.Lock()
 
-	with create_verified_ssh_client(settings.SSH_KNOWN_HOSTS_PATH) as ssh:
-		pkey = paramiko.Ed25519Key.from_private_key_file(settings.SSH_PRIVATE_KEY_PATH)
-		logger.info(
-			f'Connecting to storage server: {settings.STORAGE_SERVER_IP} as {settings.STORAGE_SERVER_USERNAME}',
-			LogContext(category=LogCategory.SSH, token=token, dataset_id=dataset_id),
-		)
-		port = 2222 if settings.DEV_MODE else 22
 
+def _connect_storage_server(token: str, dataset_id: Optional[int]) -> paramiko.SSHClient:
+	ssh = create_verified_ssh_client(settings.SSH_KNOWN_HOSTS_PATH)
+	pkey = paramiko.Ed25519Key.from_private_key_file(settings.SSH_PRIVATE_KEY_PATH)
+	logger.info(
+		f'Connecting to storage server: {settings.STORAGE_SERVER_IP} as {settings.STORAGE_SERVER_USERNAME}',
+		LogContext(category=LogCategory.SSH, token=token, dataset_id=dataset_id),
+	)
+	port = 2222 if settings.DEV_MODE else 22
+
+	try:
 		_connect_with_retry(
 			ssh,
 			hostname=settings.STORAGE_SERVER_IP,
@@ -47,154 +50,176 @@ def pull_file_from_storage_server(remote_file_path: str, local_file_path: str, t
 			pkey=pkey,
 			port=port,
 		)
+	except Exception:
+		ssh.close()
+		raise
 
-		with ssh.open_sftp() as sftp:
-			logger.info(
-				f'Pulling file from storage server: {remote_file_path} to {local_file_path}',
-				LogContext(
-					category=LogCategory.SSH,
-					token=token,
-					dataset_id=dataset_id,
-					extra={'remote_path': remote_file_path, 'local_path': local_file_path},
-				),
-			)
+	# keep idle connections from being dropped by the server or NAT between tasks
+	ssh.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL)
+	return ssh
 
-			# Create the directory for local_file_path if it doesn't exist
-			local_dir = Path(local_file_path).parent
-			local_dir.mkdir(parents=True, exist_ok=True)
-			sftp.get(remote_file_path, local_file_path)
 
-		# Check if the file exists after pulling
-		if os.path.exists(local_file_path):
-			logger.info(
-				'File successfully pulled from storage server',
-				LogContext(
-					category=LogCategory.SSH,
-					token=token,
-					dataset_id=dataset_id,
-					extra={'local_path': local_file_path, 'file_size': Path(local_file_path).stat().st_size},
-				),
-			)
-		else:
-			logger.error(
-				'File not found after pulling from storage server',
-				LogContext(
-					category=LogCategory.SSH,
-					token=token,
-					dataset_id=dataset_id,
-					extra={'remote_path': remote_file_path, 'local_path': local_file_path},
-				),
-			)
+@contextmanager
+def _open_storage_sftp(token: str, dataset_id: Optional[int] = None) -> Generator[paramiko.SFTPClient, None, None]:
+	"""Open an SFTP channel on the shared storage server connection.
 
+	The connection is (re)established when there is none yet or its transport is no longer
+	active. If opening the channel fails on a connection that still looked alive (e.g. the
+	server dropped it silently), the connection is rebuilt once. Only the channel open is
+	retried, never a transfer.
+	"""
+	global _storage_ssh
 
-def push_file_to_storage_server(local_file_path: str, remote_file_path: str, token: str, dataset_id: int):
-	with create_verified_ssh_client(settings.SSH_KNOWN_HOSTS_PATH) as ssh:
-		pkey = paramiko.Ed25519Key.from_private_key_file(settings.SSH_PRIVATE_KEY_PATH)
+	with _storage_ssh_lock:
+		for attempt in range(2):
+			transport = _storage_ssh.get_transport() if _storage_ssh is not None else None
+			if transport is None or not transport.is_active():
+				if _storage_ssh is not None:
+					_storage_ssh.close()
+				_storage_ssh = _connect_storage_server(token, dataset_id)
+
+			try:
+				sftp = _storage_ssh.open_sftp()
+				break
+			except (paramiko.SSHException, EOFError, OSError):
+				_storage_ssh.close()
+				_storage_ssh = None
+				if attempt:
+					raise
+
+	with sftp:
+		yield sftp
+
+
+def pull_file_from_storage_server(remote_file_path: str, local_file_path: str, token: str, dataset_id: int):
+	# Check if the file already exists locally
+	if os.path.exists(local_file_path):
 		logger.info(
-			f'Connecting to storage server: {settings.STORAGE_SERVER_IP} as {settings.STORAGE_SERVER_USERNAME}',
+			f'File already exists locally at: {local_file_path}',
 			LogContext(category=LogCategory.SSH, token=token, dataset_id=dataset_id),
 		)
-		port = 2222 if settings.DEV_MODE else 22
+		return
 
-		_connect_with_retry(
-			ssh,
-			hostname=settings.STORAGE_SERVER_IP,
-			username=settings.STORAGE_SERVER_USERNAME,
-			pkey=pkey,
-			port=port,
+	with _open_storage_sftp(token, dataset_id) as sftp:
+		logger.info(
+			f'Pulling file from storage server: {remote_file_path} to {local_file_path}',
+			LogContext(
+				category=LogCategory.SSH,
+				token=token,
+				dataset_id=dataset_id,
+				extra={'remote_path': remote_file_path, 'local_path': local_file_path},
+			),
 		)
 
-		with ssh.open_sftp() as sftp:
-			temp_remote_path = f'{remote_file_path}.tmp'
+		# Create the directory for local_file_path if it doesn't exist
+		local_dir = Path(local_file_path).parent
+		local_dir.mkdir(parents=True, exist_ok=True)
+		sftp.get(remote_file_path, local_file_path)
+
+	# Check if the file exists after pulling
+	if os.path.exists(local_file_path):
+		logger.info(
+			'File successfully pulled from storage server',
+			LogContext(
+				category=LogCategory.SSH,
+				token=token,
+				dataset_id=dataset_id,
+				extra={'local_path': local_file_path, 'file_size': Path(local_file_path).stat().st_size},
+			),
+		)
+	else:
+		logger.error(
+			'File not found after pulling from storage server',
+			LogContext(
+				category=LogCategory.SSH,
+				token=token,
+				dataset_id=dataset_id,
+				extra={'remote_path': remote_file_path, 'local_path': local_file_path},
+			),
+		)
+
+
+def push_file_to_storage_server(local_file_path: str, remote_file_path: str, token: str, dataset_id: int):
+	with _open_storage_sftp(token, dataset_id) as sftp:
+		temp_remote_path = f'{remote_file_path}.tmp'
 
+		try:
+			# Create parent directory if it doesn't exist (needed for UUID-prefixed paths)
+			remote_dir = str(Path(remote_file_path).parent)
 			try:
-				# Create parent directory if it doesn't exist (needed for UUID-prefixed paths)
-				remote_dir = str(Path(remote_file_path).parent)
-				try:
-					sftp.stat(remote_dir)
-				except IOError:
-					# Directory doesn't exist, create it
-					logger.info(
-						'Creating remote directory',
-						LogContext(
-							category=LogCategory.SSH,
-							token=token,
-							dataset_id=dataset_id,
-							extra={'remote_dir': remote_dir},
-						),
-					)
-					sftp.mkdir(remote_dir)
-
-				# Check if file exists on remote host
-				try:
-					sftp.stat(remote_file_path)
-					file_exists = True
-				except IOError:
-					file_exists = False
-
-				if file_exists:
-					logger.info(
-						'File exists on remote, using atomic rename approach',
-						LogContext(
-							category=LogCategory.SSH,
-							token=token,
-							dataset_id=dataset_id,
-							extra={'remote_path': remote_file_path},
-						),
-					)
-
-					# Upload to temporary location first
-					logger.info(
-						'Uploading file to temporary location',
-						LogContext(
-							category=LogCategory.SSH,
-							token=token,
-							dataset_id=dataset_id,
-							extra={'temp_path': temp_remote_path},
-						),
-					)
-					sftp.put(local_file_path, temp_remote_path)
-
-					# Move existing file to trash directory with timestamp
-					timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-					trash_filename = f'{Path(remote_file_path).stem}_{timestamp}{Path(remote_file_path).suffix}'
-					trash_path = settings.trash_path / trash_filename
-					sftp.rename(remote_file_path, str(trash_path))
-					logger.info(
-						'Moved existing file to trash',
-						LogContext(
-							category=LogCategory.SSH,
-							token=token,
-							dataset_id=dataset_id,
-							extra={'original_path': remote_file_path, 'trash_path': str(trash_path)},
-						),
-					)
-
-					# Atomic rename from temp to final location
-					logger.info(
-						'Moving file to final location',
-						LogContext(
-							category=LogCategory.SSH,
-							token=token,
-							dataset_id=dataset_id,
-							extra={'from_path': temp_remote_path, 'to_path': remote_file_path},
-						),
-					)
-					sftp.posix_rename(temp_remote_path, remote_file_path)
-				else:
-					logger.info(
-						'File does not exist on remote, uploading directly',
-						LogContext(
-							category=LogCategory.SSH,
-							token=token,
-							dataset_id=dataset_id,
-							extra={'remote_path': remote_file_path},
-						),
-					)
-					sftp.put(local_file_path, remote_file_path)
+				sftp.stat(remote_dir)
+			except IOError:
+				# Directory doesn't exist, create it
+				logger.info(
+					'Creating remote directory',
+					LogContext(
+						category=LogCategory.SSH,
+						token=token,
+						dataset_id=dataset_id,
+						extra={'remote_dir': remote_dir},
+					),
+				)
+				sftp.mkdir(remote_dir)
 
+			# Check if file exists on remote host
+			try:
+				sftp.stat(remote_file_path)
+				file_exists = True
+			except IOError:
+				file_exists = False
+
+			if file_exists:
+				logger.info(
+					'File exists on remote, using atomic rename approach',
+					LogContext(
+						category=LogCategory.SSH,
+						token=token,
+						dataset_id=dataset_id,
+						extra={'remote_path': remote_file_path},
+					),
+				)
+
+				# Upload to temporary location first
+				logger.info(
+					'Uploading file to temporary location',
+					LogContext(
+						category=LogCategory.SSH,
+						token=token,
+						dataset_id=dataset_id,
+						extra={'temp_path': temp_remote_path},
+					),
+				)
+				sftp.put(local_file_path, temp_remote_path)
+
+				# Move existing file to trash directory with timestamp
+				timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
+				trash_filename = f'{Path(remote_file_path).stem}_{timestamp}{Path(remote_file_path).suffix}'
+				trash_path = settings.trash_path / trash_filename
+				sftp.rename(remote_file_path, str(trash_path))
+				logger.info(
+					'Moved existing file to trash',
+					LogContext(
+						category=LogCategory.SSH,
+						token=token,
+						dataset_id=dataset_id,
+						extra={'original_path': remote_file_path, 'trash_path': str(trash_path)},
+					),
+				)
+
+				# Atomic rename from temp to final location
+				logger.info(
+					'Moving file to final location',
+					LogContext(
+						category=LogCategory.SSH,
+						token=token,
+						dataset_id=dataset_id,
+						extra={'from_path': temp_remote_path, 'to_path': remote_file_path},
+					),
+				)
+				sftp.posix_rename(temp_remote_path, remote_file_path)
+			else:
 				logger.info(
-					'File successfully pushed to storage server',
+					'File does not exist on remote, uploading directly',
 					LogContext(
 						category=LogCategory.SSH,
 						token=token,
@@ -202,37 +227,48 @@ def push_file_to_storage_server(local_file_path: str, remote_file_path: str, tok
 						extra={'remote_path': remote_file_path},
 					),
 				)
+				sftp.put(local_file_path, remote_file_path)
 
-			except Exception as e:
-				# Clean up temp file if it exists
-				try:
-					sftp.remove(temp_remote_path)
-					logger.info(
-						'Cleaned up temporary file after failure',
-						LogContext(
-							category=LogCategory.SSH,
-							token=token,
-							dataset_id=dataset_id,
-							extra={'temp_path': temp_remote_path, 'error': str(e)},
-						),
-					)
-				except IOError:
-					pass
-
-				logger.error(
-					'Failed to push file to storage server',
+			logger.info(
+				'File successfully pushed to storage server',
+				LogContext(
+					category=LogCategory.SSH,
+					token=token,
+					dataset_id=dataset_id,
+					extra={'remote_path': remote_file_path},
+				),
+			)
+
+		except Exception as e:
+			# Clean up temp file if it exists
+			try:
+				sftp.remove(temp_remote_path)
+				logger.info(
+					'Cleaned up temporary file after failure',
 					LogContext(
 						category=LogCategory.SSH,
 						token=token,
 						dataset_id=dataset_id,
-						extra={
-							'error': str(e),
-							'remote_path': remote_file_path,
-							'local_path': local_file_path,
-						},
+						extra={'temp_path': temp_remote_path, 'error': str(e)},
 					),
 				)
-				raise
+			except IOError:
+				pass
+
+			logger.error(
+				'Failed to push file to storage server',
+				LogContext(
+					category=LogCategory.SSH,
+					token=token,
+					dataset_id=dataset_id,
+					extra={
+						'error': str(e),
+						'remote_path': remote_file_path,
+						'local_path': local_file_path,
+					},
+				),
+			)
+			raise
 
 
 @test_environment_only
@@ -275,24 +311,11 @@ def check_file_exists_on_storage(remote_file_path: str, token: str) -> bool:
 	Returns:
 		bool: True if file exists, False otherwise
 	"""
-	with create_verified_ssh_client(settings.SSH_KNOWN_HOSTS_PATH) as ssh:
-		pkey = paramiko.Ed25519Key.from_private_key_file(settings.SSH_PRIVATE_KEY_PATH)
-
-		port = 2222 if settings.DEV_MODE else 22
-
-		_connect_with_retry(
-			ssh,
-			hostname=settings.STORAGE_SERVER_IP,
-			username=settings.STORAGE_SERVER_USERNAME,
-			pkey=pkey,
-			port=port,
-		)
-
-		with ssh.open_sftp() as sftp:
-			try:
-				sftp.stat(remote_file_path)
-				logger.info(f'File exists on storage server: {remote_file_path}', extra={'token': token})
-				return True
-			except IOError:
-				logger.info(f'File not found on storage server: {remote_file_path}', extra={'token': token})
-				return False
+	with _open_storage_sftp(token) as sftp:
+		try:
+			sftp.stat(remote_file_path)
+			logger.info(f'File exists on storage server: {remote_file_path}', extra={'token': token})
+			return True
+		except IOError:
+			logger.info(f'File not found on storage server: {remote_file_path}', extra={'token': token})
+			return False
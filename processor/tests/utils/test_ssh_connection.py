@@ -0,0 +1,92 @@
+import paramiko
+import pytest
+
+from processor.src.utils import ssh as ssh_utils
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeTransport:
+	def __init__(self):
+		self.active = True
+
+	def is_active(self):
+		return self.active
+
+
+class _FakeSFTP:
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		return False
+
+
+class _FakeSSH:
+	"""Minimal stand-in for a connected paramiko.SSHClient."""
+
+	def __init__(self, fail_open=False):
+		self.transport = _FakeTransport()
+		self.fail_open = fail_open
+		self.closed = False
+
+	def get_transport(self):
+		return self.transport
+
+	def open_sftp(self):
+		if self.fail_open:
+			raise paramiko.SSHException('SSH session not active')
+		return _FakeSFTP()
+
+	def close(self):
+		self.closed = True
+
+
+@pytest.fixture
+def connections(monkeypatch):
+	"""Record every new storage server connection, handing out queued fakes."""
+	created = []
+	queued = []
+
+	def fake_connect(token, dataset_id):
+		client = queued.pop(0) if queued else _FakeSSH()
+		created.append(client)
+		return client
+
+	monkeypatch.setattr(ssh_utils, '_connect_storage_server', fake_connect)
+	monkeypatch.setattr(ssh_utils, '_storage_ssh', None)
+	return created, queued
+
+
+def test_connection_is_reused_between_transfers(connections):
+	created, _ = connections
+
+	for _ in range(3):
+		with ssh_utils._open_storage_sftp('token', 1):
+			pass
+
+	assert len(created) == 1
+
+
+def test_inactive_connection_is_replaced(connections):
+	created, _ = connections
+
+	with ssh_utils._open_storage_sftp('token', 1):
+		pass
+	created[0].transport.active = False
+	with ssh_utils._open_storage_sftp('token', 1):
+		pass
+
+	assert len(created) == 2
+	assert created[0].closed
+
+
+def test_silently_dropped_connection_is_rebuilt_once(connections):
+	created, queued = connections
+	queued.extend([_FakeSSH(fail_open=True), _FakeSSH()])
+
+	with ssh_utils._open_storage_sftp('token', 1):
+		pass
+
+	assert len(created) == 2
+	assert created[0].closed
@@ -10,6 +10,9 @@ from pathlib import Path
 import argparse
 import shutil
 
+# UUID pattern is a hyphen-separated string at the beginning followed by underscore
+UUID_PREFIX_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}_')
+
 
 def strip_uuid_from_filename(filename: str) -> str:
 	"""
@@ -21,9 +24,7 @@ def strip_uuid_from_filename(filename: str) -> str:
 	Returns:
 	    str: Filename with UUID removed
 	"""
-	# UUID pattern is a hyphen-separated string at the beginning followed by underscore
-	uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}_'
-	return re.sub(uuid_pattern, '', filename)
+	return UUID_PREFIX_PATTERN.sub('', filename, count=1)
 
 
 def main():
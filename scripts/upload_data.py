@@ -146,15 +146,13 @@ def main():
     
     # Save failed files to resume later if needed
     if failed_files:
-        with open('failed_uploads_2.txt', 'w') as f:
-            for file in failed_files:
-                f.write(f"{file}\n")
+        Path("failed_uploads_2.txt").write_text("".join(f"{file}\n" for file in failed_files))
         print("\nFailed uploads have been saved to 'failed_uploads_2.txt'")
     
     if processing_failed:
-        with open('failed_processing_2.txt', 'w') as f:
-            for file, dataset_id in processing_failed:
-                f.write(f"{file},{dataset_id}\n")
+        Path("failed_processing_2.txt").write_text(
+            "".join(f"{file},{dataset_id}\n" for file, dataset_id in processing_failed)
+        )
         print("\nFailed processing starts have been saved to 'failed_processing_2.txt'")
 
 if __name__ == "__main__":
@@ -232,16 +232,14 @@ def main():
 
 	if failed_files:
 		failed_file_path = geonadir_results_dir / 'failed_uploads_geonadir.txt'
-		with open(failed_file_path, 'w') as f:
-			for file in failed_files:
-				f.write(f'{file}\n')
+		failed_file_path.write_text(''.join(f'{file}\n' for file in failed_files))
 		print(f'\nFailed uploads saved to: {failed_file_path}')
 
 	if processing_failed:
 		processing_failed_path = geonadir_results_dir / 'failed_processing_geonadir.txt'
-		with open(processing_failed_path, 'w') as f:
-			for file, dataset_id in processing_failed:
-				f.write(f'{file},{dataset_id}\n')
+		processing_failed_path.write_text(
+			''.join(f'{file},{dataset_id}\n' for file, dataset_id in processing_failed)
+		)
 		print(f'Failed processing starts saved to: {processing_failed_path}')
 
 	print('\nGeoNadir upload process completed!')
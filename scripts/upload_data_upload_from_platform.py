@@ -22,6 +22,9 @@ METADATA_CSV = Path(
 	'/Users/januschvajna-jehle/projects/deadwood-upload-labels/data/uploads-via-platform/v1_metadata_rows_uploads.csv'
 )
 
+# UUID pattern is a hyphen-separated string at the beginning followed by underscore
+UUID_PREFIX_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}_')
+
 
 def strip_uuid_from_filename(filename: str) -> str:
 	"""
@@ -33,9 +36,7 @@ def strip_uuid_from_filename(filename: str) -> str:
 	Returns:
 	    str: Filename with UUID removed
 	"""
-	# UUID pattern is a hyphen-separated string at the beginning followed by underscore
-	uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}_'
-	return re.sub(uuid_pattern, '', filename)
+	return UUID_PREFIX_PATTERN.sub('', filename, count=1)
 
 
 def file_exists_in_db(data_commands, filename: str) -> bool:
@@ -191,15 +192,13 @@ def main():
 
 	# Save failed files to resume later if needed
 	if failed_files:
-		with open('failed_uploads_upload_from_platform.txt', 'w') as f:
-			for file in failed_files:
-				f.write(f'{file}\n')
+		Path('failed_uploads_upload_from_platform.txt').write_text(''.join(f'{file}\n' for file in failed_files))
 		print("\nFailed uploads have been saved to 'failed_uploads_upload_from_platform.txt'")
 
 	if processing_failed:
-		with open('failed_processing_upload_from_platform.txt', 'w') as f:
-			for file, dataset_id in processing_failed:
-				f.write(f'{file},{dataset_id}\n')
+		Path('failed_processing_upload_from_platform.txt').write_text(
+			''.join(f'{file},{dataset_id}\n' for file, dataset_id in processing_failed)
+		)
 		print("\nFailed processing starts have been saved to 'failed_processing_upload_from_platform.txt'")
 
 
@@ -191,9 +191,7 @@ def main():
 
 	# Save failed files to resume later if needed
 	if failed_files:
-		with open('failed_label_uploads.txt', 'w') as f:
-			for file in failed_files:
-				f.write(f'{file}\n')
+		Path('failed_label_uploads.txt').write_text(''.join(f'{file}\n' for file in failed_files))
 		print("\nFailed uploads have been saved to 'failed_label_uploads.txt'")
 
 
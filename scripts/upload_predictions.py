@@ -6,7 +6,7 @@ import geopandas as gpd
 from shared.settings import settings
 from shared.db import use_client
 from shared.models import LabelSourceEnum, LabelTypeEnum, LabelDataEnum
-from typing import List, Optional
+from typing import Dict, TextIO
 
 # Database path configuration
 DATABASE_PATH = Path('/Users/januschvajna-jehle/projects/deadwood-upload-labels/data')
@@ -17,6 +17,9 @@ DATA_FOLDER = 'deadwood_segmentation_predictions_full_120_remaining'
 
 DELETE_EXISTING_PREDICTIONS = False
 
+# Print per-file progress messages (noisy alongside the tqdm progress bar)
+VERBOSE = False
+
 
 def load_processed_files() -> set:
 	"""Load the set of already processed files from disk
@@ -30,16 +33,16 @@ def load_processed_files() -> set:
 	return set()
 
 
-def get_dataset_id(data_commands, filename: str) -> int:
+def get_dataset_id(token: str, filename: str) -> int:
 	"""Get the dataset ID for a given orthophoto filename
 
 	Args:
+	    token: Authentication token
 	    filename: Name of the orthophoto file
 
 	Returns:
 	    int: Dataset ID
 	"""
-	token = data_commands._ensure_auth()
 	with use_client(token) as client:
 		response = client.table(settings.datasets_table).select('id').eq('file_name', filename).execute()
 		if len(response.data) == 0:
@@ -48,14 +51,14 @@ def get_dataset_id(data_commands, filename: str) -> int:
 			return response.data[0]['id']
 
 
-def mark_as_processed(filename: str):
+def mark_as_processed(processed_log: TextIO, filename: str):
 	"""Mark a file as successfully processed by appending to the processed files list
 
 	Args:
+	    processed_log: Line-buffered handle of the processed files list
 	    filename: Name of the file that was processed
 	"""
-	with open(PROCESSED_LABELS_FILE, 'a') as f:
-		f.write(f'{filename}\n')
+	processed_log.write(f'{filename}\n')
 
 
 def get_label_files(filename: str) -> Path:
@@ -70,66 +73,53 @@ def get_label_files(filename: str) -> Path:
 	return DATABASE_PATH / DATA_FOLDER / filename.replace('.tif', '_prediction.gpkg')
 
 
-def get_available_layers(gpkg_path: Path) -> List[str]:
-	"""Get available layers in a GeoPackage file
-
-	Args:
-	    gpkg_path: Path to the GeoPackage file
-
-	Returns:
-	    List[str]: List of layer names
-	"""
-	import fiona
-
-	return fiona.listlayers(str(gpkg_path))
-
-
-def check_existing_predictions(data_commands, dataset_id: int) -> Optional[int]:
-	"""Check if existing model predictions exist for a dataset
+def fetch_existing_predictions(token: str, page_size: int = 1000) -> Dict[int, int]:
+	"""Fetch all existing deadwood model prediction labels in one paged query
 
 	Args:
-	    data_commands: DataCommands instance
-	    dataset_id: Dataset ID
+	    token: Authentication token
+	    page_size: Number of rows requested per page
 
 	Returns:
-	    int: return label id if existing, None otherwise
+	    Dict[int, int]: Mapping of dataset ID to existing label ID
 	"""
-	token = data_commands._ensure_auth()
-	try:
-		with use_client(token) as client:
+	existing_by_dataset = {}
+	with use_client(token) as client:
+		start = 0
+		while True:
 			response = (
 				client.table('v2_labels')
-				.select('id')
-				.eq('dataset_id', dataset_id)
+				.select('id,dataset_id')
 				.eq('label_source', LabelSourceEnum.model_prediction.value)
 				.eq('label_data', LabelDataEnum.deadwood.value)
+				.order('id')
+				.range(start, start + page_size - 1)
 				.execute()
 			)
-			if len(response.data) > 0:
-				return response.data[0]['id']
-			else:
-				return None
-	except Exception as e:
-		print(f'Error checking existing predictions for dataset {dataset_id}: {str(e)}')
-		return None
+			for row in response.data:
+				existing_by_dataset.setdefault(row['dataset_id'], row['id'])
+			if len(response.data) < page_size:
+				break
+			start += page_size
+	return existing_by_dataset
 
 
-def delete_existing_prediction(data_commands, label_id: int) -> bool:
+def delete_existing_prediction(token: str, label_id: int) -> bool:
 	"""Delete existing model predictions for a dataset
 
 	Args:
-	    data_commands: DataCommands instance
+	    token: Authentication token
 	    label_id: Label ID
 
 	Returns:
 	    bool: True if deletion was successful, False otherwise
 	"""
-	token = data_commands._ensure_auth()
 	try:
 		with use_client(token) as client:
 			# Find labels from model predictions
 			response = client.table('v2_labels').delete().eq('id', label_id).execute()
-			print(f'Successfully deleted existing prediction label {label_id}')
+			if VERBOSE:
+				print(f'Successfully deleted existing prediction label {label_id}')
 			return True
 	except Exception as e:
 		print(f'Error deleting existing predictions for label {label_id}: {str(e)}')
@@ -150,76 +140,82 @@ def main():
 	# processed_files = load_processed_files()
 	processed_files = set()  # Empty set to process all files
 
+	# Look up existing predictions once instead of querying per dataset
+	existing_predictions = fetch_existing_predictions(data_commands._ensure_auth())
+
 	# Keep track of failed files
 	failed_files = []
 	skipped_files = []
 
-	# Process each row
-	for _, row in tqdm(df.iterrows(), total=df.shape[0]):
-		# Create new DataCommands instance for each row to ensure fresh token
-		row_data_commands = DataCommands()
-
-		# Get label file path
-		label_path = get_label_files(row['filename'])
-
-		if not label_path.exists():
-			print(f"Skipping {row['filename']} - label file not found")
-			skipped_files.append(row['filename'])
-			continue
-
-		dataset_id = get_dataset_id(row_data_commands, row['filename'])
-		if dataset_id is None:
-			print(f"Skipping {row['filename']} - dataset ID not found")
-			skipped_files.append(row['filename'])
-			continue
-
-		# Check available layers in the GeoPackage
-		available_layers = get_available_layers(label_path)
-		print(f"Available layers in {row['filename']}: {available_layers}")
-
-		try:
-			# Delete existing model predictions for this dataset
-			label_id = check_existing_predictions(row_data_commands, dataset_id)
-			if label_id is not None:
-				if DELETE_EXISTING_PREDICTIONS:
-					delete_success = delete_existing_prediction(row_data_commands, label_id)
-					if not delete_success:
-						print(f"Failed to delete existing predictions for {row['filename']}")
-						failed_files.append(row['filename'])
+	# Keep the processed files list open for the whole run; line buffering still
+	# persists every entry immediately
+	with open(PROCESSED_LABELS_FILE, 'a', buffering=1) as processed_log:
+		# Process each row
+		for _, row in tqdm(df.iterrows(), total=df.shape[0]):
+			# Create new DataCommands instance for each row to ensure fresh token
+			row_data_commands = DataCommands()
+
+			# Get label file path
+			label_path = get_label_files(row['filename'])
+
+			if not label_path.exists():
+				if VERBOSE:
+					print(f"Skipping {row['filename']} - label file not found")
+				skipped_files.append(row['filename'])
+				continue
+
+			token = row_data_commands._ensure_auth()
+			dataset_id = get_dataset_id(token, row['filename'])
+			if dataset_id is None:
+				if VERBOSE:
+					print(f"Skipping {row['filename']} - dataset ID not found")
+				skipped_files.append(row['filename'])
+				continue
+
+			try:
+				# Delete existing model predictions for this dataset
+				label_id = existing_predictions.get(dataset_id)
+				if label_id is not None:
+					if DELETE_EXISTING_PREDICTIONS:
+						delete_success = delete_existing_prediction(token, label_id)
+						if not delete_success:
+							print(f"Failed to delete existing predictions for {row['filename']}")
+							failed_files.append(row['filename'])
+							continue
+					else:
+						if VERBOSE:
+							print(
+								f"Skipping upload for {row['filename']} - existing prediction found and DELETE_EXISTING_PREDICTIONS is False"
+							)
+						skipped_files.append(row['filename'])
 						continue
+
+				upload_success = False
+
+				result = row_data_commands.upload_label_from_gpkg(
+					dataset_id=dataset_id,
+					gpkg_path=str(label_path),
+					label_source=LabelSourceEnum.model_prediction.value,
+					label_type=LabelTypeEnum.semantic_segmentation.value,
+					label_data=LabelDataEnum.deadwood.value,  # Assuming all labels are deadwood
+					label_quality=3,
+					labels_layer=None,  # First layer in the GeoPackage
+					aoi_layer=None,
+				)
+				upload_success = bool(result)
+				if upload_success and VERBOSE:
+					print(f"Successfully uploaded labels for {row['filename']}")
+
+				if upload_success:
+					mark_as_processed(processed_log, row['filename'])
 				else:
-					print(
-						f"Skipping upload for {row['filename']} - existing prediction found and DELETE_EXISTING_PREDICTIONS is False"
-					)
-					skipped_files.append(row['filename'])
-					continue
-
-			upload_success = False
-
-			result = row_data_commands.upload_label_from_gpkg(
-				dataset_id=dataset_id,
-				gpkg_path=str(label_path),
-				label_source=LabelSourceEnum.model_prediction.value,
-				label_type=LabelTypeEnum.semantic_segmentation.value,
-				label_data=LabelDataEnum.deadwood.value,  # Assuming all labels are deadwood
-				label_quality=3,
-				labels_layer=available_layers[0],
-				aoi_layer=None,
-			)
-			upload_success = bool(result)
-			if upload_success:
-				print(f"Successfully uploaded labels for {row['filename']}")
-
-			if upload_success:
-				mark_as_processed(row['filename'])
-			else:
-				print(f"Failed to upload data for {row['filename']}")
-				failed_files.append(row['filename'])
+					print(f"Failed to upload data for {row['filename']}")
+					failed_files.append(row['filename'])
 
-		except Exception as e:
-			print(f"Error processing file {row['filename']}: {str(e)}")
-			failed_files.append(row['filename'])
-			continue
+			except Exception as e:
+				print(f"Error processing file {row['filename']}: {str(e)}")
+				failed_files.append(row['filename'])
+				continue
 
 	# Print summary
 	print('\nLabel Upload Summary:')
@@ -229,9 +225,7 @@ def main():
 
 	# Save failed files to resume later if needed
 	if failed_files:
-		with open('failed_predictions_uploads.txt', 'w') as f:
-			for file in failed_files:
-				f.write(f'{file}\n')
+		Path('failed_predictions_uploads.txt').write_text(''.join(f'{file}\n' for file in failed_files))
 		print("\nFailed uploads have been saved to 'failed_predictions_uploads.txt'")
 
 
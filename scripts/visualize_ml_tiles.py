@@ -14,12 +14,15 @@ Usage:
 """
 
 import argparse
+import os
 from pathlib import Path
 from typing import List, Tuple
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from tqdm import tqdm
 
+RGB_TILE_SUFFIXES = ('_5cm.png', '_10cm.png', '_20cm.png')
+
 
 def find_tile_sets(input_dir: Path) -> List[dict]:
 	"""Find all complete tile sets (RGB + deadwood + forestcover).
@@ -30,33 +33,37 @@ def find_tile_sets(input_dir: Path) -> List[dict]:
 	Returns:
 		List of dicts with tile information
 	"""
-	# Find all RGB images (base tiles)
-	rgb_files = (
-		sorted(input_dir.glob('*_5cm.png'))
-		+ sorted(input_dir.glob('*_10cm.png'))
-		+ sorted(input_dir.glob('*_20cm.png'))
-	)
-
-	# Filter out mask files
-	rgb_files = [f for f in rgb_files if 'deadwood' not in f.name and 'forestcover' not in f.name]
+	# Scan the directory once; mask lookups below become set membership tests
+	file_names = {entry.name for entry in os.scandir(input_dir) if entry.is_file()}
+
+	# Find all RGB images (base tiles), grouped by resolution, skipping mask files
+	rgb_names = []
+	for suffix in RGB_TILE_SUFFIXES:
+		rgb_names.extend(
+			sorted(
+				name
+				for name in file_names
+				if name.endswith(suffix) and 'deadwood' not in name and 'forestcover' not in name
+			)
+		)
 
 	tile_sets = []
-	for rgb_file in rgb_files:
-		base_name = rgb_file.stem  # Remove .png
+	for rgb_name in rgb_names:
+		base_name = rgb_name[: -len('.png')]
 
 		# Find corresponding masks
-		deadwood_file = input_dir / f'{base_name}_deadwood.png'
-		forestcover_file = input_dir / f'{base_name}_forestcover.png'
-		json_file = input_dir / f'{base_name}.json'
+		deadwood_name = f'{base_name}_deadwood.png'
+		forestcover_name = f'{base_name}_forestcover.png'
+		json_name = f'{base_name}.json'
 
-		if deadwood_file.exists() and forestcover_file.exists():
+		if deadwood_name in file_names and forestcover_name in file_names:
 			tile_sets.append(
 				{
 					'name': base_name,
-					'rgb': rgb_file,
-					'deadwood': deadwood_file,
-					'forestcover': forestcover_file,
-					'json': json_file if json_file.exists() else None,
+					'rgb': input_dir / rgb_name,
+					'deadwood': input_dir / deadwood_name,
+					'forestcover': input_dir / forestcover_name,
+					'json': input_dir / json_name if json_name in file_names else None,
 				}
 			)
 
@@ -75,8 +82,9 @@ def load_and_resize_image(image_path: Path, target_size: int = 512) -> np.ndarra
 	"""
 	img = Image.open(image_path)
 
-	# Resize maintaining aspect ratio
-	img = img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+	# Resize maintaining aspect ratio; reducing_gap pre-shrinks large tiles with a
+	# cheap box filter before the LANCZOS pass
+	img = img.resize((target_size, target_size), Image.Resampling.LANCZOS, reducing_gap=3.0)
 
 	# Convert grayscale masks to RGB
 	if img.mode == 'L':
@@ -235,6 +243,14 @@ Examples:
 		default=20,
 		help='Font size for labels (default: 20)',
 	)
+	parser.add_argument(
+		'--png-compress-level',
+		type=int,
+		choices=range(10),
+		default=1,
+		metavar='{0-9}',
+		help='zlib compression level for the output PNG, 0 = uncompressed (default: 1)',
+	)
 
 	args = parser.parse_args()
 
@@ -271,7 +287,7 @@ Examples:
 	print(f'💾 Saving to: {output_path}')
 
 	img = Image.fromarray(visualization)
-	img.save(output_path, 'PNG', optimize=False)
+	img.save(output_path, 'PNG', optimize=False, compress_level=args.png_compress_level)
 
 	print(f'✅ Visualization saved!')
 	print(f'   Size: {visualization.shape[1]}x{visualization.shape[0]} pixels')
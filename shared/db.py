@@ -1,5 +1,11 @@
 from typing import Union, Literal, Optional, Generator, Any
+from collections import OrderedDict
 from contextlib import contextmanager
+from functools import lru_cache
+import base64
+import hashlib
+import json
+import threading
 import time
 import logging
 
@@ -14,6 +20,36 @@ logger = logging.getLogger(__name__)
 # Global variable to store the cached session
 cached_session = None
 
+# Number of distinct (key, access token) clients kept alive for reuse
+CLIENT_CACHE_SIZE = 32
+
+# Successfully verified tokens, keyed by the token's sha256 digest: (expires_at, user)
+TOKEN_CACHE_SIZE = 10_000
+_verified_tokens: 'OrderedDict[bytes, tuple[float, Any]]' = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
+
+@lru_cache(maxsize=CLIENT_CACHE_SIZE)
+def _get_cached_client(supabase_url: str, supabase_key: str, access_token: Optional[str] = None) -> Client:
+	"""Returns a supabase client bound to one key/access token pair.
+
+	Clients are cached so repeated ``use_client`` calls reuse the same GoTrue/PostgREST
+	clients and their keep-alive HTTP connections instead of rebuilding them (and
+	re-handshaking TLS) on every call. Each cached client is bound to exactly one
+	access token, so no caller can inherit another caller's identity.
+	"""
+	client = create_client(
+		supabase_url,
+		supabase_key,
+		options=ClientOptions(auto_refresh_token=False),
+	)
+
+	# set the access token to the postgrest (rest-api) client if available
+	if access_token is not None:
+		client.postgrest.auth(token=access_token)
+
+	return client
+
 
 def login(user: str, password: str, use_cached_session: bool = True) -> str:
 	"""
@@ -29,12 +65,6 @@ def login(user: str, password: str, use_cached_session: bool = True) -> str:
 	"""
 	global cached_session
 
-	client = create_client(
-		settings.SUPABASE_URL,
-		settings.SUPABASE_KEY,
-		options=ClientOptions(auto_refresh_token=False),
-	)
-
 	current_time = int(time.time())
 	threshold = 60 * 20  # 20 minutes before expiration
 
@@ -43,16 +73,24 @@ def login(user: str, password: str, use_cached_session: bool = True) -> str:
 		if cached_session.session.expires_at > (current_time + threshold):
 			print('session is still valid')
 			return cached_session.session.access_token
-		else:
-			print('session is expired, refreshing')
-			try:
-				refreshed_session = client.auth.refresh_session()
-				cached_session = refreshed_session
-				print('session refreshed')
-				return cached_session.session.access_token
-			except Exception:
-				print('session refresh failed, clearing cache')
-				cached_session = None
+
+	# only build an auth client when the cached session can't be returned as is
+	client = create_client(
+		settings.SUPABASE_URL,
+		settings.SUPABASE_KEY,
+		options=ClientOptions(auto_refresh_token=False),
+	)
+
+	if cached_session and use_cached_session:
+		print('session is expired, refreshing')
+		try:
+			refreshed_session = client.auth.refresh_session()
+			cached_session = refreshed_session
+			print('session refreshed')
+			return cached_session.session.access_token
+		except Exception:
+			print('session refresh failed, clearing cache')
+			cached_session = None
 
 	# If no valid cached session, perform a new login
 	try:
@@ -79,9 +117,56 @@ def login_verified(user: str, password: str) -> tuple[str, Union[Literal[False],
 	return token, user_obj
 
 
+def _token_expires_at(jwt: str) -> Optional[float]:
+	"""Reads the ``exp`` claim from a jwt without verifying its signature.
+
+	Only used to bound how long an already verified token is cached.
+	"""
+	try:
+		payload = jwt.split('.')[1]
+		payload += '=' * (-len(payload) % 4)
+		return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+	except Exception:
+		return None
+
+
+def _get_verified_user(key: bytes) -> Union[Literal[False], Any]:
+	"""Returns the cached user for a verified token digest, or False if missing or expired"""
+	with _verified_tokens_lock:
+		entry = _verified_tokens.get(key)
+		if entry is None:
+			return False
+		expires_at, user = entry
+		if expires_at <= time.time():
+			del _verified_tokens[key]
+			return False
+		_verified_tokens.move_to_end(key)
+		return user
+
+
+def _cache_verified_user(key: bytes, jwt: str, user: Any) -> None:
+	"""Caches a verified user for JWT_CACHE_TTL seconds, never beyond the token's expiry"""
+	now = time.time()
+	expires_at = now + settings.JWT_CACHE_TTL
+	token_expires_at = _token_expires_at(jwt)
+	if token_expires_at is not None:
+		expires_at = min(expires_at, token_expires_at)
+	if expires_at <= now:
+		return
+
+	with _verified_tokens_lock:
+		_verified_tokens[key] = (expires_at, user)
+		_verified_tokens.move_to_end(key)
+		while len(_verified_tokens) > TOKEN_CACHE_SIZE:
+			_verified_tokens.popitem(last=False)
+
+
 def verify_token(jwt: str) -> Union[Literal[False], Any]:
 	"""Verifies a user jwt token string against the active supabase sessions
 
+	Successful verifications are cached for ``settings.JWT_CACHE_TTL`` seconds (capped
+	at the token's own expiry); failed verifications are never cached.
+
 	Args:
 	    jwt (str): A jwt token string
 
@@ -90,11 +175,16 @@ def verify_token(jwt: str) -> Union[Literal[False], Any]:
 	"""
 	global cached_session
 
-	# make the authentication
+	key = hashlib.sha256(jwt.encode()).digest()
+	user = _get_verified_user(key)
+	if user:
+		return user
+
+	# make the authentication; get_user sends the jwt itself, so the shared unauthenticated
+	# client is enough and no per-token client has to be built just for this call
 	try:
-		with use_client(jwt) as client:
+		with use_client() as client:
 			response = client.auth.get_user(jwt)
-		return response.user
 	except Exception as e:
 		# If verification fails and we have a cached session, clear it
 		# This handles the case where the session was invalidated server-side
@@ -103,10 +193,14 @@ def verify_token(jwt: str) -> Union[Literal[False], Any]:
 			cached_session = None
 		return False
 
+	if response.user and settings.JWT_CACHE_TTL > 0:
+		_cache_verified_user(key, jwt, response.user)
+	return response.user
+
 
 @contextmanager
 def use_client(access_token: Optional[str] = None) -> Generator[Client, None, None]:
-	"""Creates and returns a supabase client session
+	"""Returns a cached supabase client session bound to the access token
 
 	Args:
 	    access_token (Optional[str], optional): Optional access token. Defaults to None.
@@ -114,22 +208,7 @@ def use_client(access_token: Optional[str] = None) -> Generator[Client, None, No
 	Yields:
 	    Generator[Client, None, None]: A supabase client session
 	"""
-	# create a supabase client
-	client = create_client(
-		settings.SUPABASE_URL,
-		settings.SUPABASE_KEY,
-		options=ClientOptions(auto_refresh_token=False),
-	)
-
-	# yield the client
-	try:
-		# set the access token to the postgrest (rest-api) client if available
-		if access_token is not None:
-			client.postgrest.auth(token=access_token)
-
-		yield client
-	finally:
-		pass
+	yield _get_cached_client(settings.SUPABASE_URL, settings.SUPABASE_KEY, access_token)
 
 
 @contextmanager
@@ -138,16 +217,7 @@ def use_service_client() -> Generator[Client, None, None]:
 	if not settings.SUPABASE_SERVICE_ROLE_KEY:
 		raise ValueError('SUPABASE_SERVICE_ROLE_KEY is required for service-role database access')
 
-	client = create_client(
-		settings.SUPABASE_URL,
-		settings.SUPABASE_SERVICE_ROLE_KEY,
-		options=ClientOptions(auto_refresh_token=False),
-	)
-
-	try:
-		yield client
-	finally:
-		pass
+	yield _get_cached_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
 
 
 @contextmanager
@@ -156,19 +226,17 @@ def use_anon_client(access_token: Optional[str] = None) -> Generator[Client, Non
 	if not settings.SUPABASE_ANON_KEY:
 		raise ValueError('SUPABASE_ANON_KEY is required for anonymous/public client access')
 
-	client = create_client(
-		settings.SUPABASE_URL,
-		settings.SUPABASE_ANON_KEY,
-		options=ClientOptions(auto_refresh_token=False),
-	)
+	yield _get_cached_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY, access_token)
 
-	try:
-		if access_token is not None:
-			client.postgrest.auth(token=access_token)
 
-		yield client
-	finally:
-		pass
+@lru_cache(maxsize=None)
+def _primary_field(Model: type[BaseModel]) -> str:
+	"""Returns the field used to look up ``Model`` rows - prioritize dataset_id over id"""
+	if 'dataset_id' in Model.model_fields:
+		return 'dataset_id'
+	if 'id' in Model.model_fields:
+		return 'id'
+	raise AttributeError('Model does not have an id field')
 
 
 class SupabaseReader(BaseModel):
@@ -180,16 +248,10 @@ class SupabaseReader(BaseModel):
 		"""Reads an instance from the bound model from
 		supabase.
 		"""
-		# figure out the primary field - prioritize dataset_id over id
-		if 'dataset_id' in self.Model.model_fields:
-			id_field = 'dataset_id'
-		elif 'id' in self.Model.model_fields:
-			id_field = 'id'
-		else:
-			raise AttributeError('Model does not have an id field')
+		id_field = _primary_field(self.Model)
 
 		with use_client(self.token) as client:
-			result = client.table(self.table).select('*').eq(id_field, dataset_id).execute()
+			result = client.table(self.table).select('*').eq(id_field, dataset_id).limit(1).execute()
 
 		if len(result.data) == 0:
 			return None
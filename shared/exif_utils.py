@@ -35,6 +35,20 @@ _ORIENTATION_XMP_PATTERN = re.compile(
 )
 _ORIENTATION_NUMBER_PATTERN = re.compile(rb'[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?')
 
+# Pointer from IFD0 to the Exif sub-IFD holding DateTimeOriginal/DateTimeDigitized
+_EXIF_IFD_POINTER = 0x8769
+# (tag id, tag name, stored in the Exif sub-IFD) in order of preference
+_DATETIME_TAGS = (
+	(306, 'DateTime', False),
+	(36867, 'DateTimeOriginal', True),
+	(36868, 'DateTimeDigitized', True),
+)
+# Canonical EXIF "YYYY:MM:DD HH:MM:SS"; anything else falls back to strptime
+_EXIF_DATETIME_PATTERN = re.compile(r'^(\d{4}):(\d{2}):(\d{2}) (\d{2}):(\d{2}):(\d{2})$')
+_EXIF_DATETIME_FORMATS = ('%Y:%m:%d %H:%M:%S', '%Y-%m-%d %H:%M:%S')
+# Opaque vendor blob (often kilobytes); decoding and sanitizing it yields no usable metadata
+_MAKER_NOTE_TAG = 37500
+
 
 def _normalise_camera_orientation(name: bytes, value: bytes) -> Optional[tuple[float, str, float]]:
 	"""Convert a supported metadata convention to off-nadir degrees."""
@@ -113,13 +127,13 @@ def _sanitize_text_for_db(text: str) -> str:
 	if not text:
 		return ''
 
-	# Remove null characters and other problematic Unicode characters
-	# PostgreSQL doesn't support null characters (\x00, \u0000)
-	sanitized = text.replace('\x00', '').replace('\u0000', '')
-
-	# Remove other control characters that might cause issues
-	# Keep only printable characters, spaces, tabs, and newlines
-	sanitized = ''.join(char for char in sanitized if char.isprintable() or char in '\t\n\r ')
+	# Remove null characters and other control characters PostgreSQL can't store or that
+	# might cause issues. Keep only printable characters, spaces, tabs, and newlines.
+	# str.isprintable() is a single C-level scan, so the per-character filter only runs
+	# for the rare strings that actually contain such characters.
+	sanitized = text
+	if not sanitized.isprintable():
+		sanitized = ''.join(char for char in sanitized if char.isprintable() or char in '\t\n\r')
 
 	# Strip whitespace and ensure there's meaningful content
 	sanitized = sanitized.strip()
@@ -151,13 +165,17 @@ def extract_comprehensive_exif(image_path: Path) -> Dict[str, Any]:
 			exif_data = img._getexif()
 
 			if exif_data is None:
-				logger.debug(f'No EXIF data found in image: {image_path}', LogContext(category=LogCategory.UPLOAD))
+				logger.debug(
+					'No EXIF data found in image: %s', image_path, context=LogContext(category=LogCategory.UPLOAD)
+				)
 				return {}
 
 			# Convert numeric EXIF tags to human-readable names
 			exif_dict = {}
+			get_tag_name = TAGS.get
+			exif_data.pop(_MAKER_NOTE_TAG, None)
 			for tag_id, value in exif_data.items():
-				tag_name = TAGS.get(tag_id, tag_id)
+				tag_name = get_tag_name(tag_id, tag_id)
 
 				# Handle special cases where values might be tuples or need conversion
 				if isinstance(value, tuple) and len(value) == 2:
@@ -206,7 +224,10 @@ def extract_comprehensive_exif(image_path: Path) -> Dict[str, Any]:
 					continue
 
 			logger.debug(
-				f'Extracted {len(exif_dict)} EXIF tags from {image_path}', LogContext(category=LogCategory.UPLOAD)
+				'Extracted %d EXIF tags from %s',
+				len(exif_dict),
+				image_path,
+				context=LogContext(category=LogCategory.UPLOAD),
 			)
 
 			return exif_dict
@@ -218,6 +239,24 @@ def extract_comprehensive_exif(image_path: Path) -> Dict[str, Any]:
 		return {}
 
 
+def _parse_exif_datetime(date_string: str) -> Optional[datetime]:
+	"""Parse an EXIF datetime string, returning None if it is not a valid date."""
+	match = _EXIF_DATETIME_PATTERN.match(date_string)
+	if match:
+		try:
+			return datetime(*map(int, match.groups()))
+		except ValueError:
+			# Placeholder values such as "0000:00:00 00:00:00"
+			return None
+
+	for fmt in _EXIF_DATETIME_FORMATS:
+		try:
+			return datetime.strptime(date_string, fmt)
+		except ValueError:
+			continue
+	return None
+
+
 def extract_acquisition_date(image_path: Path) -> Optional[datetime]:
 	"""
 	Extract the acquisition date from image EXIF data.
@@ -227,51 +266,48 @@ def extract_acquisition_date(image_path: Path) -> Optional[datetime]:
 	2. DateTimeOriginal (original photo date/time)
 	3. DateTimeDigitized (when photo was digitized)
 
+	Only these three tags are read; the rest of the EXIF block is never decoded.
+
 	Args:
 	    image_path: Path to the image file
 
 	Returns:
 	    datetime object if acquisition date found, None otherwise
 	"""
-	exif_data = extract_comprehensive_exif(image_path)
-
-	if not exif_data:
+	if Image is None:
+		logger.warning('PIL/Pillow not available - EXIF extraction disabled', LogContext(category=LogCategory.UPLOAD))
 		return None
 
-	# List of EXIF fields to check for date/time, in order of preference
-	datetime_fields = [
-		'DateTime',  # Most common field for when photo was taken
-		'DateTimeOriginal',  # Original photo date/time
-		'DateTimeDigitized',  # When photo was digitized
-	]
-
-	for field in datetime_fields:
-		if field in exif_data:
-			date_string = exif_data[field]
-
-			try:
-				# EXIF datetime format is typically "YYYY:MM:DD HH:MM:SS"
-				if isinstance(date_string, str):
-					# Replace colons in date part with hyphens for proper parsing
-					normalized_date = date_string.replace(':', '-', 2)
-					# Try parsing with different formats
-					for fmt in ['%Y-%m-%d %H:%M:%S', '%Y:%m:%d %H:%M:%S']:
-						try:
-							acquisition_date = datetime.strptime(date_string, fmt)
-							logger.debug(
-								f'Extracted acquisition date from {field}: {acquisition_date}',
-								LogContext(category=LogCategory.UPLOAD),
-							)
-							return acquisition_date
-						except ValueError:
-							continue
+	try:
+		with Image.open(image_path) as img:
+			exif = img.getexif()
+			exif_ifd = exif.get_ifd(_EXIF_IFD_POINTER)
+			date_values = [
+				(field, (exif_ifd if in_exif_ifd else exif).get(tag_id))
+				for tag_id, field, in_exif_ifd in _DATETIME_TAGS
+			]
+	except Exception as e:
+		logger.error(
+			f'Failed to extract EXIF data from {image_path}: {str(e)}', LogContext(category=LogCategory.UPLOAD)
+		)
+		return None
 
-			except Exception as e:
-				logger.warning(
-					f"Failed to parse date from {field} field '{date_string}': {str(e)}",
-					LogContext(category=LogCategory.UPLOAD),
-				)
-				continue
+	for field, date_string in date_values:
+		if not isinstance(date_string, str):
+			continue
+
+		acquisition_date = _parse_exif_datetime(date_string.strip('\x00 '))
+		if acquisition_date is None:
+			continue
+		logger.debug(
+			'Extracted acquisition date from %s: %s',
+			field,
+			acquisition_date,
+			context=LogContext(category=LogCategory.UPLOAD),
+		)
+		return acquisition_date
 
-	logger.debug(f'No acquisition date found in EXIF data for {image_path}', LogContext(category=LogCategory.UPLOAD))
+	logger.debug(
+		'No acquisition date found in EXIF data for %s', image_path, context=LogContext(category=LogCategory.UPLOAD)
+	)
 	return None
@@ -1,21 +1,42 @@
 import hashlib
+import os
 from pathlib import Path
 
+READ_BUFFER_SIZE = 1024 * 1024
+
+
+def _hash_window(hasher, f, length: int, buffer: memoryview) -> None:
+	"""Feed ``length`` bytes from the current file position into ``hasher`` through a reused buffer"""
+	while length > 0:
+		n = f.readinto(buffer[: min(length, len(buffer))])
+		if not n:
+			break
+		hasher.update(buffer[:n])
+		length -= n
+
 
 def get_file_identifier(file_path: Path, sample_size: int = 10 * 1024 * 1024) -> str:
 	"""Generate a quick file identifier by sampling start/end of file"""
 	file_size = file_path.stat().st_size
+	window_size = min(sample_size, file_size)
 	hasher = hashlib.sha256()
+	buffer = memoryview(bytearray(READ_BUFFER_SIZE))
+
+	with open(file_path, 'rb', buffering=0) as f:
+		# Ask the kernel to prefetch both windows up front, so reading the tail
+		# overlaps with hashing the head (no-op where posix_fadvise is unavailable)
+		if hasattr(os, 'posix_fadvise'):
+			os.posix_fadvise(f.fileno(), 0, window_size, os.POSIX_FADV_WILLNEED)
+			os.posix_fadvise(f.fileno(), file_size - window_size, window_size, os.POSIX_FADV_WILLNEED)
 
-	with open(file_path, 'rb') as f:
 		# Hash file size
 		hasher.update(str(file_size).encode())
 
 		# Hash first 10MB
-		hasher.update(f.read(sample_size))
+		_hash_window(hasher, f, window_size, buffer)
 
 		# Hash last 10MB
-		f.seek(-min(sample_size, file_size), 2)
-		hasher.update(f.read(sample_size))
+		f.seek(-window_size, 2)
+		_hash_window(hasher, f, window_size, buffer)
 
 	return hasher.hexdigest()
@@ -1,8 +1,8 @@
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+import shapely
 from shapely.geometry import shape, MultiPolygon, Polygon
-from shapely import wkb
 
 from shared.models import (
 	LabelPayloadData,
@@ -27,8 +27,9 @@ from shared.retry import retry_on_transient_error, is_statement_timeout
 # Insert time scales with both the byte size *and* the number of rows (each row
 # updates the spatial index), so we cap on both. These are first-line limits;
 # ``_insert_records_adaptive`` handles any chunk that still exceeds the budget.
-MAX_CHUNK_SIZE = 1024 * 1024 * 2  # 2MB of WKB per chunk
-MAX_CHUNK_GEOMETRIES = 2000  # rows per chunk
+# Labels below both caps (the common case) are written with a single INSERT.
+MAX_CHUNK_SIZE = settings.LABEL_GEOMETRY_CHUNK_BYTES  # bytes of WKB per chunk
+MAX_CHUNK_GEOMETRIES = settings.LABEL_GEOMETRY_CHUNK_ROWS  # rows per chunk
 
 
 def create_label_with_geometries(payload: LabelPayloadData, user_id: str, token: str) -> Label:
@@ -36,9 +37,9 @@ def create_label_with_geometries(payload: LabelPayloadData, user_id: str, token:
 	through chunking.
 	"""
 
-	aoi_id = None
+	aoi_payload = None
 	if payload.aoi_geometry or payload.aoi_is_whole_image:
-		# Handle AOI creation/reuse
+		# AOI creation/reuse happens inside the create_label_with_aoi RPC
 		aoi = AOI(
 			dataset_id=payload.dataset_id,
 			user_id=user_id,
@@ -47,37 +48,11 @@ def create_label_with_geometries(payload: LabelPayloadData, user_id: str, token:
 			image_quality=payload.aoi_image_quality,
 			notes=payload.aoi_notes,
 		)
-
-		with use_client(token) as client:
-			# Check for existing whole-image AOI
-			if payload.aoi_is_whole_image:
-				response = (
-					client.table(settings.aois_table)
-					.select('id')
-					.eq('dataset_id', payload.dataset_id)
-					.eq('is_whole_image', True)
-					.execute()
-				)
-				if response.data:
-					aoi_id = response.data[0]['id']
-
-			# Create new AOI if needed
-			if not aoi_id:
-				try:
-					response = (
-						client.table(settings.aois_table)
-						.insert(aoi_insert_payload(aoi))
-						.execute()
-					)
-					aoi_id = response.data[0]['id']
-				except Exception as e:
-					logger.error(f'Error creating AOI: {str(e)}', extra={'token': token, 'user_id': user_id})
-					raise Exception(f'Error creating AOI: {str(e)}')
+		aoi_payload = aoi_insert_payload(aoi)
 
 	# Create label entry
 	label = Label(
 		dataset_id=payload.dataset_id,
-		aoi_id=aoi_id,
 		user_id=user_id,
 		label_source=payload.label_source,
 		label_type=payload.label_type,
@@ -86,67 +61,76 @@ def create_label_with_geometries(payload: LabelPayloadData, user_id: str, token:
 		model_metadata=payload.model_metadata,
 	)
 
+	# Prepare geometry chunks before touching the database so invalid geometries fail
+	# without leaving an empty label behind
+	geom = shape(payload.geometry.model_dump())
+	if not isinstance(geom, MultiPolygon):
+		geom = MultiPolygon([geom])
+
+	# Split MultiPolygon into individual polygons
+	chunks = _split_into_chunks(list(geom.geoms))
+
+	# Determine geometry table based on label_data
+	geom_table = (
+		settings.deadwood_geometries_table
+		if payload.label_data == LabelDataEnum.deadwood
+		else settings.forest_cover_geometries_table
+	)
+
+	GeometryModel = DeadwoodGeometry if payload.label_data == LabelDataEnum.deadwood else ForestCoverGeometry
+
 	# Start transaction for label and geometries
 	with use_client(token) as client:
 		try:
-			# Insert label
-			response = (
-				client.table(settings.labels_table)
-				.insert(label.model_dump(by_alias=True, exclude={'id', 'created_at', 'updated_at'}))
-				.execute()
-			)
-			label_id = response.data[0]['id']
+			# Create (or reuse) the AOI and insert the label in a single round trip
+			response = client.rpc(
+				'create_label_with_aoi',
+				{
+					'p_label': label.model_dump(mode='json', by_alias=True, exclude={'id', 'created_at', 'updated_at'}),
+					'p_aoi': aoi_payload,
+				},
+			).execute()
+			label_row = response.data
+			label_id = label_row['id']
+
+			# Chunks are inserted one after another: the idempotent retry in
+			# _insert_records_with_retry counts the label's rows, which concurrent
+			# chunk inserts would make ambiguous
+			for chunk in chunks:
+				upload_geometry_chunk(client, geom_table, GeometryModel, label_id, chunk, payload.properties, token)
+
+			return Label(**label_row)
 
-			# Process geometries
-			geom = shape(payload.geometry.model_dump())
-			if not isinstance(geom, MultiPolygon):
-				geom = MultiPolygon([geom])
+		except Exception as e:
+			logger.error(f'Error creating label: {str(e)}', extra={'token': token, 'user_id': user_id})
+			raise Exception(f'Error creating label: {str(e)}')
 
-			# Split MultiPolygon into individual polygons
-			polygons = [poly for poly in geom.geoms]
 
-			# Determine geometry table based on label_data
-			geom_table = (
-				settings.deadwood_geometries_table
-				if payload.label_data == LabelDataEnum.deadwood
-				else settings.forest_cover_geometries_table
-			)
+def _split_into_chunks(polygons: List[Polygon]) -> List[List[Polygon]]:
+	"""Groups polygons into insert chunks bounded by MAX_CHUNK_SIZE bytes of WKB and
+	MAX_CHUNK_GEOMETRIES rows.
+	"""
+	# Encode all polygons to WKB in one vectorized call to estimate their sizes
+	sizes = [len(wkb_geom) for wkb_geom in shapely.to_wkb(polygons)]
+
+	chunks = []
+	chunk_start = 0
+	current_chunk_size = 0
+
+	for index, geom_size in enumerate(sizes):
+		exceeds_size = current_chunk_size + geom_size > MAX_CHUNK_SIZE
+		exceeds_count = index - chunk_start >= MAX_CHUNK_GEOMETRIES
+		if index > chunk_start and (exceeds_size or exceeds_count):
+			chunks.append(polygons[chunk_start:index])
+			chunk_start = index
+			current_chunk_size = 0
 
-			GeometryModel = DeadwoodGeometry if payload.label_data == LabelDataEnum.deadwood else ForestCoverGeometry
+		current_chunk_size += geom_size
 
-			# Split geometries into chunks
-			current_chunk_size = 0
-			current_chunk = []
-
-			for polygon in polygons:
-				# Convert to WKB to estimate size
-				wkb_geom = wkb.dumps(polygon)
-				geom_size = len(wkb_geom)
-
-				exceeds_size = current_chunk_size + geom_size > MAX_CHUNK_SIZE
-				exceeds_count = len(current_chunk) >= MAX_CHUNK_GEOMETRIES
-				if current_chunk and (exceeds_size or exceeds_count):
-					# Upload current chunk
-					upload_geometry_chunk(
-						client, geom_table, GeometryModel, label_id, current_chunk, payload.properties, token
-					)
-					current_chunk = []
-					current_chunk_size = 0
-
-				current_chunk.append(polygon)
-				current_chunk_size += geom_size
-
-			# Upload remaining geometries
-			if current_chunk:
-				upload_geometry_chunk(
-					client, geom_table, GeometryModel, label_id, current_chunk, payload.properties, token
-				)
-
-			return Label(**response.data[0])
+	if chunk_start < len(polygons):
+		chunks.append(polygons[chunk_start:])
 
-		except Exception as e:
-			logger.error(f'Error creating label: {str(e)}', extra={'token': token, 'user_id': user_id})
-			raise Exception(f'Error creating label: {str(e)}')
+	return chunks
 
 
 def upload_geometry_chunk(
@@ -160,18 +144,24 @@ def upload_geometry_chunk(
 ) -> None:
 	"""Uploads a chunk of geometries to the database."""
 
-	geometry_records = []
-	for geom in geometries:
-		# Convert the geometry to a single polygon
-		if isinstance(geom, MultiPolygon):
-			raise ValueError('Expected Polygon geometry, received MultiPolygon')
-
-		# Ensure we're working with a valid polygon
-		if not isinstance(geom, Polygon):
-			raise ValueError(f'Expected Polygon geometry, received {type(geom)}')
-
-		geometry = GeometryModel(label_id=label_id, geometry=geom.__geo_interface__, properties=properties)
-		geometry_records.append(geometry.model_dump(exclude={'id', 'created_at'}))
+	# Check polygon-ness for the whole chunk in one vectorized call; only walk the
+	# geometries to build the error message when something is off
+	if not (shapely.get_type_id(geometries) == shapely.GeometryType.POLYGON).all():
+		for geom in geometries:
+			# Convert the geometry to a single polygon
+			if isinstance(geom, MultiPolygon):
+				raise ValueError('Expected Polygon geometry, received MultiPolygon')
+
+			# Ensure we're working with a valid polygon
+			if not isinstance(geom, Polygon):
+				raise ValueError(f'Expected Polygon geometry, received {type(geom)}')
+
+	geometry_records = [
+		GeometryModel(label_id=label_id, geometry=geom.__geo_interface__, properties=properties).model_dump(
+			exclude={'id', 'created_at'}
+		)
+		for geom in geometries
+	]
 
 	try:
 		_insert_records_adaptive(client, table, geometry_records, label_id, token)
@@ -252,53 +242,23 @@ def delete_model_prediction_labels(
 	Returns:
 		int: Number of labels deleted
 	"""
-	deleted_count = 0
-
 	with use_client(token) as client:
 		try:
-			# First, get all model prediction labels for this dataset with the specified label data type
-			response = (
-				client.table(settings.labels_table)
-				.select('id,model_config')
-				.eq('dataset_id', dataset_id)
-				.eq('label_source', LabelSourceEnum.model_prediction.value)
-				.eq('label_data', label_data.value)
-				.execute()
-			)
-
-			if model_config:
-				labels_to_delete = [
-					label
-					for label in response.data
-					if label.get('model_config') is None
-					or all(label.get('model_config', {}).get(key) == value for key, value in model_config.items())
-				]
-			else:
-				labels_to_delete = response.data
-
-			if not labels_to_delete:
+			# Select and delete the matching labels in a single statement
+			response = client.rpc(
+				'delete_model_prediction_labels',
+				{
+					'p_dataset_id': dataset_id,
+					'p_label_data': label_data.value,
+					'p_model_config': model_config or None,
+				},
+			).execute()
+			deleted_count = response.data or 0
+
+			if not deleted_count:
 				# No existing labels found
 				return 0
 
-			# Get label IDs to delete
-			label_ids = [label['id'] for label in labels_to_delete]
-			deleted_count = len(label_ids)
-
-			# Determine geometry table based on label_data
-			# geom_table = (
-			# 	settings.deadwood_geometries_table
-			# 	if label_data == LabelDataEnum.deadwood
-			# 	else settings.forest_cover_geometries_table
-			# )
-
-			# Delete all geometries for these labels
-			# Note: This isn't strictly necessary due to ON DELETE CASCADE, but being explicit
-			# for label_id in label_ids:
-			# client.table(geom_table).delete().eq('label_id', label_id).execute()
-
-			# Delete the labels themselves
-			client.table(settings.labels_table).delete().in_('id', label_ids).execute()
-
 			logger.info(
 				f'Deleted {deleted_count} existing model prediction labels for dataset {dataset_id}',
 				LogContext(category=LogCategory.LABEL, dataset_id=dataset_id, token=token),
@@ -1,5 +1,8 @@
 import logging
-from typing import Any, Dict, Optional
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 from shared.settings import settings
 from shared.__version__ import __version__
@@ -50,10 +53,98 @@ class LogContext:
 		self.extra = extra or {}
 
 
+class SupabaseLogWriter:
+	"""Writes log entries to the v2_logs table from a single background thread.
+
+	Entries are queued by the logging caller and inserted in batches (one insert per
+	access token per batch), so logging never blocks on a Supabase round trip. When the
+	queue is full, the oldest entries are dropped and reported on stdout instead of
+	applying backpressure to the caller.
+	"""
+
+	def __init__(self, max_queue_size: int = 10_000, batch_size: int = 200, flush_interval: float = 0.5):
+		self.batch_size = batch_size
+		self.flush_interval = flush_interval
+		self._queue: 'queue.Queue[Tuple[Optional[str], Dict[str, Any]]]' = queue.Queue(maxsize=max_queue_size)
+		self._thread: Optional[threading.Thread] = None
+		self._thread_lock = threading.Lock()
+
+	def put(self, token: Optional[str], log_entry: Dict[str, Any]) -> None:
+		self._ensure_started()
+		while True:
+			try:
+				self._queue.put_nowait((token, log_entry))
+				return
+			except queue.Full:
+				pass
+
+			# Drop the oldest queued entry so the most recent logs win under backpressure
+			try:
+				_, dropped_entry = self._queue.get_nowait()
+			except queue.Empty:
+				continue
+			self._queue.task_done()
+			print(f'v2_logs queue full, dropping log entry: {dropped_entry.get("message")}')
+
+	def flush(self, timeout: float = 5.0) -> None:
+		"""Waits until all queued entries have been written (or the timeout passes)"""
+		if self._thread is None:
+			return
+		with self._queue.all_tasks_done:
+			self._queue.all_tasks_done.wait_for(lambda: not self._queue.unfinished_tasks, timeout)
+
+	def _ensure_started(self) -> None:
+		if self._thread is not None and self._thread.is_alive():
+			return
+		with self._thread_lock:
+			if self._thread is None or not self._thread.is_alive():
+				self._thread = threading.Thread(target=self._run, name='supabase-log-writer', daemon=True)
+				self._thread.start()
+
+	def _run(self) -> None:
+		while True:
+			batch = [self._queue.get()]
+			deadline = time.monotonic() + self.flush_interval
+			while len(batch) < self.batch_size:
+				remaining = deadline - time.monotonic()
+				if remaining <= 0:
+					break
+				try:
+					batch.append(self._queue.get(timeout=remaining))
+				except queue.Empty:
+					break
+
+			try:
+				self._write(batch)
+			finally:
+				for _ in batch:
+					self._queue.task_done()
+
+	def _write(self, batch: List[Tuple[Optional[str], Dict[str, Any]]]) -> None:
+		entries_by_token: Dict[Optional[str], List[Dict[str, Any]]] = {}
+		for token, log_entry in batch:
+			entries_by_token.setdefault(token, []).append(log_entry)
+
+		for token, log_entries in entries_by_token.items():
+			try:
+				# Insert into v2_logs table
+				with use_client(token) as client:
+					client.table(settings.logs_table).insert(log_entries).execute()
+			except Exception as e:
+				# Fallback to print if logging fails
+				print(f'Error writing to v2_logs: {str(e)}')
+				for log_entry in log_entries:
+					print(f'Failed log entry: {log_entry["message"]}')
+
+
+# One writer (and background thread) shared by every SupabaseHandler in the process
+supabase_log_writer = SupabaseLogWriter()
+
+
 class SupabaseHandler(logging.Handler):
-	def __init__(self):
+	def __init__(self, writer: Optional[SupabaseLogWriter] = None):
 		super().__init__()
-		self.use_client = use_client
+		self.writer = writer or supabase_log_writer
 
 	def emit(self, record: logging.LogRecord) -> None:
 		try:
@@ -77,15 +168,18 @@ class SupabaseHandler(logging.Handler):
 				'extra': getattr(record, 'extra', None),
 			}
 
-			# Insert into v2_logs table
-			with self.use_client(token) as client:
-				client.table(settings.logs_table).insert(log_entry).execute()
+			# Queue for the background writer
+			self.writer.put(token, log_entry)
 
 		except Exception as e:
 			# Fallback to print if logging fails
 			print(f'Error writing to v2_logs: {str(e)}')
 			print(f'Failed log entry: {record.getMessage()}')
 
+	def flush(self) -> None:
+		# Called by logging.shutdown() at interpreter exit, so queued entries are not lost
+		self.writer.flush()
+
 
 class UnifiedLogger(logging.Logger):
 	def __init__(self, name: str):
@@ -105,6 +199,10 @@ class UnifiedLogger(logging.Logger):
 			self.setLevel(logging.INFO if settings.DEV_MODE else logging.INFO)
 
 	def _log_with_context(self, level: int, msg: str, context: LogContext, *args: Any, **kwargs: Any) -> None:
+		# Skip building the context dict for records that would be filtered out anyway
+		if not self.isEnabledFor(level):
+			return
+
 		if isinstance(context, LogContext):
 			extra = {
 				'category': context.category.value if context.category else None,
@@ -1,18 +1,15 @@
-from typing import Optional, List, Dict, Any, Tuple, Literal, Union, Annotated
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple, Literal, Union, Annotated
 from enum import Enum
 from datetime import datetime
 
-from pydantic import AliasChoices, BaseModel, field_serializer, field_validator, model_validator, Field
+from pydantic import AliasChoices, BaseModel, TypeAdapter, field_serializer, field_validator, Field
 from pydantic_partial import PartialModelMixin
-from pydantic_settings import BaseSettings
-from rasterio.coords import BoundingBox
 
 from .asset_manifest import (
 	AOI_V1_MODEL_CHECKPOINT_NAME,
 	COMBINED_MODEL_CHECKPOINT_NAME,
 	DEADWOOD_V1_MODEL_CHECKPOINT_NAME,
 )
-from .settings import settings
 
 
 # Custom 2D-only GeoJSON models (replacing pydantic_geojson which adds alt=None)
@@ -36,6 +33,17 @@ class MultiPolygonModel(BaseModel):
 	coordinates: List[List[List[Coordinate2D]]]
 
 
+# 1-3 quality rating for AOIs and labels, checked in pydantic-core instead of a Python validator
+QualityRating = Annotated[int, Field(ge=1, le=3)]
+
+
+def _datetime_to_isoformat(field: datetime | None) -> str | None:
+	"""Plain serializer shared by every model that stores timestamps as ISO strings."""
+	if field is None:
+		return None
+	return field.isoformat()
+
+
 class LabelDataEnum(str, Enum):
 	deadwood = 'deadwood'
 	forest_cover = 'forest_cover'
@@ -188,6 +196,8 @@ class TaskPayload(BaseModel):
 	created_at: Optional[datetime] = None
 	task_types: List[TaskTypeEnum]
 
+	model_config = {'frozen': True}
+
 
 class QueueTask(BaseModel):
 	id: int
@@ -201,6 +211,8 @@ class QueueTask(BaseModel):
 	estimated_time: float | None = None
 	task_types: List[TaskTypeEnum]
 
+	model_config = {'frozen': True}
+
 
 class Status(BaseModel):
 	"""
@@ -227,11 +239,9 @@ class Status(BaseModel):
 	created_at: Optional[datetime] = None
 	updated_at: Optional[datetime] = None
 
-	@field_serializer('created_at', 'updated_at', mode='plain')
-	def datetime_to_isoformat(field: datetime | None) -> str | None:
-		if field is None:
-			return None
-		return field.isoformat()
+	datetime_to_isoformat = field_serializer('created_at', 'updated_at', mode='plain')(_datetime_to_isoformat)
+
+	model_config = {'frozen': True}
 
 
 class Thumbnail(BaseModel):
@@ -242,6 +252,8 @@ class Thumbnail(BaseModel):
 	version: int
 	thumbnail_processing_runtime: float
 
+	model_config = {'frozen': True}
+
 
 class Dataset(PartialModelMixin, BaseModel):
 	"""
@@ -257,40 +269,15 @@ class Dataset(PartialModelMixin, BaseModel):
 	platform: PlatformEnum
 	project_id: Optional[str] = None
 	authors: List[str]
-	aquisition_year: Optional[int] = None
-	aquisition_month: Optional[int] = None
-	aquisition_day: Optional[int] = None
+	aquisition_year: Optional[Annotated[int, Field(ge=1980, le=2099)]] = None
+	aquisition_month: Optional[Annotated[int, Field(ge=1, le=12)]] = None
+	aquisition_day: Optional[Annotated[int, Field(ge=1, le=31)]] = None
 	additional_information: Optional[str] = None
 	data_access: DatasetAccessEnum = DatasetAccessEnum.public
 	citation_doi: Optional[str] = None
 	archived: bool = False
 
-	@field_serializer('created_at', mode='plain')
-	def datetime_to_isoformat(field: datetime | None) -> str | None:
-		if field is None:
-			return None
-		return field.isoformat()
-
-	@field_validator('aquisition_year')
-	@classmethod
-	def validate_year(cls, v: Optional[int]) -> Optional[int]:
-		if v is not None and (v < 1980 or v > 2099):
-			raise ValueError('Year must be between 1980 and 2099')
-		return v
-
-	@field_validator('aquisition_month')
-	@classmethod
-	def validate_month(cls, v: Optional[int]) -> Optional[int]:
-		if v is not None and (v < 1 or v > 12):
-			raise ValueError('Month must be between 1 and 12')
-		return v
-
-	@field_validator('aquisition_day')
-	@classmethod
-	def validate_day(cls, v: Optional[int]) -> Optional[int]:
-		if v is not None and (v < 1 or v > 31):
-			raise ValueError('Day must be between 1 and 31')
-		return v
+	datetime_to_isoformat = field_serializer('created_at', mode='plain')(_datetime_to_isoformat)
 
 
 class RawImages(BaseModel):
@@ -344,11 +331,7 @@ class RawImages(BaseModel):
 	version: int = 1
 	created_at: Optional[datetime] = None
 
-	@field_serializer('created_at', mode='plain')
-	def datetime_to_isoformat(field: datetime | None) -> str | None:
-		if field is None:
-			return None
-		return field.isoformat()
+	datetime_to_isoformat = field_serializer('created_at', mode='plain')(_datetime_to_isoformat)
 
 
 class Cog(BaseModel):
@@ -365,11 +348,41 @@ class Cog(BaseModel):
 	cog_info: Optional[Dict] = None
 	cog_processing_runtime: Optional[float] = None
 
-	@field_serializer('created_at', mode='plain')
-	def datetime_to_isoformat(field: datetime | None) -> str | None:
-		if field is None:
-			return None
-		return field.isoformat()
+	datetime_to_isoformat = field_serializer('created_at', mode='plain')(_datetime_to_isoformat)
+
+	model_config = {'frozen': True}
+
+
+class BoundingBox(NamedTuple):
+	"""Bounding box in EPSG:4326, field-compatible with rasterio.coords.BoundingBox."""
+
+	left: float
+	bottom: float
+	right: float
+	top: float
+
+
+def _parse_postgis_box(raw_string: str) -> BoundingBox:
+	"""Parse a PostGIS box2d string like 'BOX(left bottom,right top)'."""
+	# removeprefix/removesuffix return the string itself when there is nothing to strip,
+	# so the only new strings are the two halves and the four numbers
+	ll, _, ur = raw_string.strip().removeprefix('BOX(').removesuffix(')').partition(',')
+	left, bottom = ll.split()
+	right, top = ur.split()
+	return BoundingBox(
+		left=float(left),
+		bottom=float(bottom),
+		right=float(right),
+		top=float(top),
+	)
+
+
+def _format_postgis_box(bbox: Optional[BoundingBox]) -> Optional[str]:
+	"""Serialize a bbox back to the PostGIS box2d text form."""
+	if bbox is None:
+		return None
+	left, bottom, right, top = bbox
+	return f'BOX({left} {bottom},{right} {top})'
 
 
 class Ortho(BaseModel):
@@ -388,35 +401,18 @@ class Ortho(BaseModel):
 	ortho_info: Optional[Dict] = None
 	ortho_upload_runtime: Optional[float] = None
 
-	@field_serializer('created_at', mode='plain')
-	def datetime_to_isoformat(field: datetime | None) -> str | None:
-		if field is None:
-			return None
-		return field.isoformat()
+	datetime_to_isoformat = field_serializer('created_at', mode='plain')(_datetime_to_isoformat)
 
 	@field_validator('bbox', mode='before')
 	@classmethod
 	def transform_bbox(cls, raw_string: Optional[str | BoundingBox]) -> Optional[BoundingBox]:
-		if raw_string is None:
-			return None
 		if isinstance(raw_string, str):
-			s = raw_string.replace('BOX(', '').replace(')', '')
-			ll, ur = s.split(',')
-			left, bottom = ll.strip().split(' ')
-			right, top = ur.strip().split(' ')
-			return BoundingBox(
-				left=float(left),
-				bottom=float(bottom),
-				right=float(right),
-				top=float(top),
-			)
+			return _parse_postgis_box(raw_string)
 		return raw_string
 
-	@field_serializer('bbox', mode='plain')
-	def bbox_to_postgis(self, bbox: Optional[BoundingBox]) -> Optional[str]:
-		if bbox is None:
-			return None
-		return f'BOX({bbox.left} {bbox.bottom},{bbox.right} {bbox.top})'
+	bbox_to_postgis = field_serializer('bbox', mode='plain')(_format_postgis_box)
+
+	model_config = {'frozen': True}
 
 
 class ProcessedOrtho(BaseModel):
@@ -435,35 +431,18 @@ class ProcessedOrtho(BaseModel):
 	ortho_info: Optional[Dict] = None
 	ortho_processing_runtime: Optional[float] = None
 
-	@field_serializer('created_at', mode='plain')
-	def datetime_to_isoformat(field: datetime | None) -> str | None:
-		if field is None:
-			return None
-		return field.isoformat()
+	datetime_to_isoformat = field_serializer('created_at', mode='plain')(_datetime_to_isoformat)
 
 	@field_validator('bbox', mode='before')
 	@classmethod
 	def transform_bbox(cls, raw_string: Optional[str | BoundingBox]) -> Optional[BoundingBox]:
-		if raw_string is None:
-			return None
 		if isinstance(raw_string, str):
-			s = raw_string.replace('BOX(', '').replace(')', '')
-			ll, ur = s.split(',')
-			left, bottom = ll.strip().split(' ')
-			right, top = ur.strip().split(' ')
-			return BoundingBox(
-				left=float(left),
-				bottom=float(bottom),
-				right=float(right),
-				top=float(top),
-			)
+			return _parse_postgis_box(raw_string)
 		return raw_string
 
-	@field_serializer('bbox', mode='plain')
-	def bbox_to_postgis(self, bbox: Optional[BoundingBox]) -> Optional[str]:
-		if bbox is None:
-			return None
-		return f'BOX({bbox.left} {bbox.bottom},{bbox.right} {bbox.top})'
+	bbox_to_postgis = field_serializer('bbox', mode='plain')(_format_postgis_box)
+
+	model_config = {'frozen': True}
 
 
 class LabelPayloadData(PartialModelMixin, BaseModel):
@@ -476,7 +455,7 @@ class LabelPayloadData(PartialModelMixin, BaseModel):
 	# AOI related fields
 	aoi_geometry: Optional[MultiPolygonModel] = None
 	aoi_is_whole_image: bool = False
-	aoi_image_quality: Optional[int] = None
+	aoi_image_quality: Optional[QualityRating] = None
 	aoi_notes: Optional[str] = None
 
 	# Label related fields
@@ -484,7 +463,7 @@ class LabelPayloadData(PartialModelMixin, BaseModel):
 	label_source: LabelSourceEnum
 	label_type: LabelTypeEnum
 	label_data: LabelDataEnum
-	label_quality: Optional[int] = None
+	label_quality: Optional[QualityRating] = None
 	model_metadata: Optional[Dict[str, Any]] = Field(
 		default=None,
 		validation_alias=AliasChoices('model_config', 'model_metadata'),
@@ -495,12 +474,6 @@ class LabelPayloadData(PartialModelMixin, BaseModel):
 	geometry: MultiPolygonModel
 	properties: Optional[Dict[str, Any]] = None
 
-	@field_validator('aoi_image_quality', 'label_quality')
-	def validate_quality(cls, v):
-		if v is not None and not 1 <= v <= 3:
-			raise ValueError('Quality must be between 1 and 3')
-		return v
-
 
 PartialLabelPayloadData = LabelPayloadData.model_as_partial()
 
@@ -514,6 +487,8 @@ class UserLabelObject(BaseModel):
 	label_description: str
 	audited: bool
 
+	model_config = {'frozen': True}
+
 
 class AOI(BaseModel):
 	"""Area of Interest model for v2_aois table"""
@@ -525,17 +500,11 @@ class AOI(BaseModel):
 	is_whole_image: bool = False
 	source: Literal['ml_prediction', 'manual', 'manual_correction'] = 'manual'
 	corrected_from_aoi_id: Optional[int] = None
-	image_quality: Optional[int] = None
+	image_quality: Optional[QualityRating] = None
 	notes: Optional[str] = None
 	created_at: Optional[datetime] = None
 	updated_at: Optional[datetime] = None
 
-	@field_validator('image_quality')
-	def validate_image_quality(cls, v):
-		if v is not None and not 1 <= v <= 3:
-			raise ValueError('Image quality must be between 1 and 3')
-		return v
-
 
 def aoi_insert_payload(aoi: AOI) -> Dict:
 	"""Serialize AOIs for rolling compatibility with the pre-provenance schema."""
@@ -552,7 +521,7 @@ class Label(BaseModel):
 	label_source: LabelSourceEnum
 	label_type: LabelTypeEnum
 	label_data: LabelDataEnum
-	label_quality: Optional[int] = None
+	label_quality: Optional[QualityRating] = None
 	model_metadata: Optional[Dict[str, Any]] = Field(
 		default=None,
 		validation_alias=AliasChoices('model_config', 'model_metadata'),
@@ -565,11 +534,9 @@ class Label(BaseModel):
 	created_at: Optional[datetime] = None
 	updated_at: Optional[datetime] = None
 
-	@field_validator('label_quality')
-	def validate_label_quality(cls, v):
-		if v is not None and not 1 <= v <= 3:
-			raise ValueError('Label quality must be between 1 and 3')
-		return v
+
+# Validates a whole page of v2_labels rows in one pydantic-core call
+LabelListAdapter = TypeAdapter(List[Label])
 
 
 class ModelPreference(BaseModel):
@@ -593,11 +560,7 @@ class DeadwoodGeometry(BaseModel):
 	properties: Optional[Dict[str, Any]] = None
 	created_at: Optional[datetime] = None
 
-	@field_serializer('created_at', mode='plain')
-	def datetime_to_isoformat(field: datetime | None) -> str | None:
-		if field is None:
-			return None
-		return field.isoformat()
+	datetime_to_isoformat = field_serializer('created_at', mode='plain')(_datetime_to_isoformat)
 
 
 class ForestCoverGeometry(BaseModel):
@@ -609,11 +572,7 @@ class ForestCoverGeometry(BaseModel):
 	properties: Optional[Dict[str, Any]] = None
 	created_at: Optional[datetime] = None
 
-	@field_serializer('created_at', mode='plain')
-	def datetime_to_isoformat(field: datetime | None) -> str | None:
-		if field is None:
-			return None
-		return field.isoformat()
+	datetime_to_isoformat = field_serializer('created_at', mode='plain')(_datetime_to_isoformat)
 
 
 class MetadataType(str, Enum):
@@ -632,6 +591,8 @@ class AdminBoundariesMetadata(BaseModel):
 	source: str = 'GADM'
 	version: str = '4.1.0'  # GADM version
 
+	model_config = {'frozen': True, 'defer_build': True}
+
 
 class BiomeMetadata(BaseModel):
 	"""Structure for WWF Terrestrial Ecoregions biome metadata"""
@@ -641,6 +602,8 @@ class BiomeMetadata(BaseModel):
 	source: str = 'WWF Terrestrial Ecoregions'
 	version: str = '2.0'  # WWF Ecoregions version
 
+	model_config = {'frozen': True, 'defer_build': True}
+
 
 class PhenologyMetadata(BaseModel):
 	"""Structure for MODIS phenology metadata"""
@@ -657,6 +620,8 @@ class PhenologyMetadata(BaseModel):
 			raise ValueError('Phenology curve must have exactly 366 values')
 		return v
 
+	model_config = {'defer_build': True}
+
 
 class DatasetMetadata(BaseModel):
 	"""Model for the v2_metadata table"""
@@ -667,11 +632,7 @@ class DatasetMetadata(BaseModel):
 	created_at: Optional[datetime] = None
 	processing_runtime: Optional[float] = None
 
-	@field_serializer('created_at', mode='plain')
-	def datetime_to_isoformat(field: datetime | None) -> str | None:
-		if field is None:
-			return None
-		return field.isoformat()
+	datetime_to_isoformat = field_serializer('created_at', mode='plain')(_datetime_to_isoformat)
 
 
 class DatasetAudit(BaseModel):
@@ -696,8 +657,6 @@ class DatasetAudit(BaseModel):
 	audited_by: Optional[str] = None  # UUID as string
 	notes: Optional[str] = None
 
-	@field_serializer('audit_date', mode='plain')
-	def datetime_to_isoformat(field: datetime | None) -> str | None:
-		if field is None:
-			return None
-		return field.isoformat()
+	datetime_to_isoformat = field_serializer('audit_date', mode='plain')(_datetime_to_isoformat)
+
+	model_config = {'defer_build': True}
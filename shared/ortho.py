@@ -1,3 +1,4 @@
+import math
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -9,19 +10,67 @@ from shared.logger import logger
 from shared.utils import get_transformed_bounds, format_bbox_string
 
 
+# Leaf types that are already JSON compliant and need no further inspection
+_JSON_SCALAR_TYPES = frozenset({str, int, bool, type(None)})
+
+
 def sanitize_json_data(data):
 	"""Recursively sanitize data to ensure JSON compliance by converting non-compliant values to strings."""
+	# ortho_info is mostly made of plain scalars, so return those before the isinstance chain
+	if type(data) in _JSON_SCALAR_TYPES:
+		return data
+	if type(data) is float:
+		return data if math.isfinite(data) else str(data)
 	if isinstance(data, dict):
 		return {k: sanitize_json_data(v) for k, v in data.items()}
 	elif isinstance(data, (list, tuple)):
 		return [sanitize_json_data(item) for item in data]
-	elif isinstance(data, float) and (str(data) == 'nan' or str(data) == 'inf' or str(data) == '-inf'):
+	elif isinstance(data, float) and not math.isfinite(data):
 		return str(data)
 	elif hasattr(data, '__dict__'):
 		return sanitize_json_data(data.__dict__)
 	return data
 
 
+def _upsert_ortho_row(
+	table: str,
+	dataset_id: int,
+	file_path: Path,
+	version: int,
+	token: str,
+	sha256: Optional[str],
+	ortho_info: Optional[dict],
+	runtime_field: str,
+	runtime: Optional[float],
+) -> dict:
+	"""Upsert the ortho row describing file_path into table and return the stored row"""
+	# Get bbox from file
+	bbox = get_transformed_bounds(file_path)
+	bbox_string = format_bbox_string(bbox)
+
+	# Sanitize ortho_info if present
+	sanitized_ortho_info = sanitize_json_data(ortho_info) if ortho_info is not None else None
+
+	# Prepare ortho data
+	ortho_data = {
+		'dataset_id': dataset_id,
+		'ortho_file_name': file_path.name,
+		'version': version,
+		'ortho_file_size': max(1, file_path.stat().st_size >> 20),  # in MB
+		'bbox': bbox_string,
+		'sha256': sha256,
+		'ortho_info': sanitized_ortho_info,
+		runtime_field: runtime,
+	}
+
+	# Remove None values
+	ortho_data = {k: v for k, v in ortho_data.items() if v is not None}
+
+	with use_client(token) as client:
+		response = client.table(table).upsert(ortho_data).execute()
+		return response.data[0]
+
+
 def upsert_ortho_entry(
 	dataset_id: int,
 	file_path: Path,
@@ -33,33 +82,18 @@ def upsert_ortho_entry(
 ) -> Ortho:
 	"""Create or update an original ortho entry in the database"""
 	try:
-		# Get bbox from file
-		bbox = get_transformed_bounds(file_path)
-		bbox_string = format_bbox_string(bbox)
-
-		# Sanitize ortho_info if present
-		sanitized_ortho_info = sanitize_json_data(ortho_info) if ortho_info is not None else None
-
-		# Prepare ortho data
-		ortho_data = {
-			'dataset_id': dataset_id,
-			'ortho_file_name': file_path.name,
-			'version': version,
-			'ortho_file_size': max(1, int((file_path.stat().st_size / 1024 / 1024))),  # in MB
-			'bbox': bbox_string,
-			'sha256': sha256,
-			'ortho_info': sanitized_ortho_info,
-			'ortho_upload_runtime': ortho_upload_runtime,
-		}
-
-		# Remove None values
-		ortho_data = {k: v for k, v in ortho_data.items() if v is not None}
-		ortho = Ortho(**ortho_data)
-
-		with use_client(token) as client:
-			send_data = {k: v for k, v in ortho.model_dump().items() if k != 'id' and v is not None}
-			response = client.table(settings.orthos_table).upsert(send_data).execute()
-			return Ortho(**response.data[0])
+		row = _upsert_ortho_row(
+			settings.orthos_table,
+			dataset_id,
+			file_path,
+			version,
+			token,
+			sha256,
+			ortho_info,
+			'ortho_upload_runtime',
+			ortho_upload_runtime,
+		)
+		return Ortho(**row)
 
 	except Exception as e:
 		logger.exception(f'Error upserting ortho entry: {str(e)}', extra={'token': token})
@@ -77,33 +111,18 @@ def upsert_processed_ortho_entry(
 ) -> ProcessedOrtho:
 	"""Create or update a processed ortho entry in the database"""
 	try:
-		# Get bbox from file
-		bbox = get_transformed_bounds(file_path)
-		bbox_string = format_bbox_string(bbox)
-
-		# Sanitize ortho_info if present
-		sanitized_ortho_info = sanitize_json_data(ortho_info) if ortho_info is not None else None
-
-		# Prepare processed ortho data
-		processed_ortho_data = {
-			'dataset_id': dataset_id,
-			'ortho_file_name': file_path.name,
-			'version': version,
-			'ortho_file_size': max(1, int((file_path.stat().st_size / 1024 / 1024))),  # in MB
-			'bbox': bbox_string,
-			'sha256': sha256,
-			'ortho_info': sanitized_ortho_info,
-			'ortho_processing_runtime': ortho_processing_runtime,
-		}
-
-		# Remove None values
-		processed_ortho_data = {k: v for k, v in processed_ortho_data.items() if v is not None}
-		processed_ortho = ProcessedOrtho(**processed_ortho_data)
-
-		with use_client(token) as client:
-			send_data = {k: v for k, v in processed_ortho.model_dump().items() if k != 'id' and v is not None}
-			response = client.table(settings.orthos_processed_table).upsert(send_data).execute()
-			return ProcessedOrtho(**response.data[0])
+		row = _upsert_ortho_row(
+			settings.orthos_processed_table,
+			dataset_id,
+			file_path,
+			version,
+			token,
+			sha256,
+			ortho_info,
+			'ortho_processing_runtime',
+			ortho_processing_runtime,
+		)
+		return ProcessedOrtho(**row)
 
 	except Exception as e:
 		logger.exception(f'Error upserting processed ortho entry: {str(e)}', extra={'token': token})
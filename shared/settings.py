@@ -110,6 +110,11 @@ class Settings(BaseSettings):
 	SUPABASE_ANON_KEY: str = ''
 	SUPABASE_SERVICE_ROLE_KEY: str = ''  # Optional: for accessing auth.users table
 	SUPABASE_DB_URL: str = ''  # Local/test-only direct connection for DB concurrency checks
+	# Per-INSERT caps for label geometries; raise together with the database statement_timeout
+	LABEL_GEOMETRY_CHUNK_BYTES: int = 1024 * 1024 * 2
+	LABEL_GEOMETRY_CHUNK_ROWS: int = 2000
+	# Seconds a successfully verified JWT is trusted without asking Supabase again (0 disables)
+	JWT_CACHE_TTL: int = 30
 
 	# some basic settings for the UVICORN server
 	UVICORN_HOST: str = '127.0.0.1' if DEV_MODE else '0.0.0.0'
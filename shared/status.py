@@ -87,8 +87,16 @@ def update_status(
 			@retry_on_transient_error
 			def _write_status() -> None:
 				with use_client(token) as client:
-					# First check if status exists
-					result = client.table(settings.statuses_table).select('id').eq('dataset_id', dataset_id).execute()
+					# First check if status exists. Don't infer it from an empty UPDATE result:
+					# RLS hides rows from callers that may not update them, and since dataset_id
+					# is not unique an insert would then add a duplicate status row.
+					result = (
+						client.table(settings.statuses_table)
+						.select('id')
+						.eq('dataset_id', dataset_id)
+						.limit(1)
+						.execute()
+					)
 
 					if not result.data:
 						# Create new status row if it doesn't exist
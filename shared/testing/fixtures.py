@@ -42,8 +42,8 @@ def test_processor_user(request):
 	user_id = None
 
 	try:
-		# Try to sign up the processor user
-		response = supabase.auth.sign_up(
+		# The processor user usually exists already, so sign in first (one auth round-trip)
+		response = supabase.auth.sign_in_with_password(
 			{
 				'email': settings.PROCESSOR_USERNAME,
 				'password': settings.PROCESSOR_PASSWORD,
@@ -51,17 +51,17 @@ def test_processor_user(request):
 		)
 		user_id = response.user.id if response.user else None
 	except Exception:
-		# If user already exists, try to get the user ID
+		# If the user does not exist yet, sign it up
 		try:
-			response = supabase.auth.sign_in_with_password(
+			response = supabase.auth.sign_up(
 				{
 					'email': settings.PROCESSOR_USERNAME,
 					'password': settings.PROCESSOR_PASSWORD,
 				}
 			)
 			user_id = response.user.id if response.user else None
-		except Exception as sign_in_error:
-			print(f'Note: Processor user setup - {str(sign_in_error)}')
+		except Exception as sign_up_error:
+			print(f'Note: Processor user setup - {str(sign_up_error)}')
 
 	# Yield to run tests
 	yield user_id
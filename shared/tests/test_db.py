@@ -1,3 +1,9 @@
+import base64
+import json
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
 import pytest
 
 import shared.db as db
@@ -51,3 +57,119 @@ def test_use_service_client_requires_service_role_key(monkeypatch):
 	with pytest.raises(ValueError, match='SUPABASE_SERVICE_ROLE_KEY is required'):
 		with db.use_service_client():
 			pass
+
+
+class _FakePostgrest:
+	def __init__(self):
+		self.token = None
+
+	def auth(self, token):
+		self.token = token
+
+
+class _FakeClient:
+	"""Stand-in for a supabase client: records the postgrest token and answers auth.get_user."""
+
+	def __init__(self, user=None, calls=None):
+		self.postgrest = _FakePostgrest()
+		self.auth = SimpleNamespace(get_user=self._get_user)
+		self._user = user
+		self._calls = calls
+
+	def _get_user(self, jwt):
+		self._calls.jwts.append(jwt)
+		return SimpleNamespace(user=self._user)
+
+
+def test_use_client_reuses_client_per_access_token(monkeypatch):
+	created = []
+
+	def fake_create_client(url, key, options=None):
+		client = _FakeClient()
+		created.append(client)
+		return client
+
+	monkeypatch.setattr(db, 'create_client', fake_create_client)
+	db._get_cached_client.cache_clear()
+
+	try:
+		with db.use_client('token-a') as first:
+			pass
+		with db.use_client('token-a') as second:
+			pass
+		with db.use_client('token-b') as other:
+			pass
+	finally:
+		db._get_cached_client.cache_clear()
+
+	assert first is second
+	assert other is not first
+	assert len(created) == 2
+	assert first.postgrest.token == 'token-a'
+	assert other.postgrest.token == 'token-b'
+
+
+def _fake_jwt(exp):
+	payload = base64.urlsafe_b64encode(json.dumps({'exp': exp}).encode()).decode().rstrip('=')
+	return f'header.{payload}.signature'
+
+
+def _patch_get_user(monkeypatch, user):
+	"""Route verify_token to a fake client; returns the recorded jwts and use_client tokens"""
+	calls = SimpleNamespace(jwts=[], client_tokens=[])
+
+	@contextmanager
+	def fake_use_client(token=None):
+		calls.client_tokens.append(token)
+		yield _FakeClient(user, calls)
+
+	monkeypatch.setattr(db, 'use_client', fake_use_client)
+	monkeypatch.setattr(db, '_verified_tokens', db.OrderedDict())
+	return calls
+
+
+def test_verify_token_caches_successful_verification(monkeypatch):
+	calls = _patch_get_user(monkeypatch, {'id': 'user-1'})
+	monkeypatch.setattr(db.settings, 'JWT_CACHE_TTL', 30)
+	jwt = _fake_jwt(time.time() + 3600)
+
+	assert db.verify_token(jwt) == {'id': 'user-1'}
+	assert db.verify_token(jwt) == {'id': 'user-1'}
+	assert calls.jwts == [jwt]
+
+
+def test_verify_token_does_not_cache_failures_or_expired_tokens(monkeypatch):
+	monkeypatch.setattr(db.settings, 'JWT_CACHE_TTL', 30)
+
+	calls = _patch_get_user(monkeypatch, None)
+	jwt = _fake_jwt(time.time() + 3600)
+	assert not db.verify_token(jwt)
+	assert not db.verify_token(jwt)
+	assert len(calls.jwts) == 2
+
+	calls = _patch_get_user(monkeypatch, {'id': 'user-1'})
+	expired = _fake_jwt(time.time() - 10)
+	db.verify_token(expired)
+	db.verify_token(expired)
+	assert len(calls.jwts) == 2
+
+
+def test_verify_token_does_not_build_a_client_per_token(monkeypatch):
+	calls = _patch_get_user(monkeypatch, {'id': 'user-1'})
+	monkeypatch.setattr(db.settings, 'JWT_CACHE_TTL', 0)
+
+	db.verify_token(_fake_jwt(time.time() + 3600))
+	db.verify_token(_fake_jwt(time.time() + 7200))
+
+	assert calls.client_tokens == [None, None]
+
+
+def test_login_returns_valid_cached_session_without_building_a_client(monkeypatch):
+	def fail_create_client(*args, **kwargs):
+		raise AssertionError('no client should be created for a valid cached session')
+
+	session = SimpleNamespace(access_token='cached-token', expires_at=int(time.time()) + 3600)
+	monkeypatch.setattr(db, 'create_client', fail_create_client)
+	monkeypatch.setattr(db, 'cached_session', SimpleNamespace(session=session))
+
+	assert db.login('processor@deadtrees.earth', 'secret') == 'cached-token'
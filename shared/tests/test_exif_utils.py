@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from PIL import Image
+
+from shared.exif_utils import _sanitize_text_for_db, extract_acquisition_date
+
+
+def _write_jpeg(path, ifd0=None, exif_ifd=None):
+	exif = Image.Exif()
+	for tag_id, value in (ifd0 or {}).items():
+		exif[tag_id] = value
+	if exif_ifd:
+		sub_ifd = exif.get_ifd(0x8769)
+		sub_ifd.update(exif_ifd)
+	Image.new('RGB', (8, 8)).save(path, 'JPEG', exif=exif)
+	return path
+
+
+def test_extract_acquisition_date_prefers_datetime_tag(tmp_path):
+	image_path = _write_jpeg(
+		tmp_path / 'image.jpg',
+		ifd0={306: '2024:05:01 10:11:12'},
+		exif_ifd={36867: '2023:01:02 03:04:05'},
+	)
+
+	assert extract_acquisition_date(image_path) == datetime(2024, 5, 1, 10, 11, 12)
+
+
+def test_extract_acquisition_date_reads_exif_sub_ifd(tmp_path):
+	image_path = _write_jpeg(tmp_path / 'image.jpg', exif_ifd={36867: '2023:01:02 03:04:05'})
+
+	assert extract_acquisition_date(image_path) == datetime(2023, 1, 2, 3, 4, 5)
+
+
+def test_extract_acquisition_date_without_exif(tmp_path):
+	image_path = _write_jpeg(tmp_path / 'image.jpg')
+
+	assert extract_acquisition_date(image_path) is None
+
+
+def test_extract_acquisition_date_skips_placeholder_dates(tmp_path):
+	image_path = _write_jpeg(
+		tmp_path / 'image.jpg',
+		ifd0={306: '0000:00:00 00:00:00'},
+		exif_ifd={36867: '2023-01-02 03:04:05'},
+	)
+
+	assert extract_acquisition_date(image_path) == datetime(2023, 1, 2, 3, 4, 5)
+
+
+def test_sanitize_text_for_db_strips_control_characters():
+	assert _sanitize_text_for_db('DJI FC6310') == 'DJI FC6310'
+	assert _sanitize_text_for_db('DJI\x00 FC\x016310\t') == 'DJI FC6310'
+	assert _sanitize_text_for_db('\x00\x00 ..') == ''
@@ -0,0 +1,45 @@
+import pytest
+from shapely.geometry import MultiPolygon, Polygon
+
+import shared.labels as labels
+from shared.models import DeadwoodGeometry
+
+
+def _squares(count):
+	return [Polygon([(i, 0), (i, 1), (i + 1, 1), (i + 1, 0), (i, 0)]) for i in range(count)]
+
+
+def test_split_into_chunks_caps_geometry_count(monkeypatch):
+	monkeypatch.setattr(labels, 'MAX_CHUNK_GEOMETRIES', 3)
+	polygons = _squares(7)
+
+	chunks = labels._split_into_chunks(polygons)
+
+	assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+	assert [polygon for chunk in chunks for polygon in chunk] == polygons
+
+
+def test_split_into_chunks_caps_wkb_bytes(monkeypatch):
+	polygons = _squares(5)
+	polygon_size = len(polygons[0].wkb)
+	monkeypatch.setattr(labels, 'MAX_CHUNK_SIZE', polygon_size * 2)
+
+	chunks = labels._split_into_chunks(polygons)
+
+	assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_split_into_chunks_keeps_oversized_polygon_alone(monkeypatch):
+	monkeypatch.setattr(labels, 'MAX_CHUNK_SIZE', 1)
+
+	chunks = labels._split_into_chunks(_squares(2))
+
+	assert [len(chunk) for chunk in chunks] == [1, 1]
+
+
+def test_upload_geometry_chunk_rejects_multipolygons():
+	polygons = _squares(2)
+	geometries = [polygons[0], MultiPolygon(polygons)]
+
+	with pytest.raises(ValueError, match='received MultiPolygon'):
+		labels.upload_geometry_chunk(None, 'v2_deadwood_geometries', DeadwoodGeometry, 1, geometries, None, 'token')
@@ -0,0 +1,88 @@
+import logging
+from contextlib import contextmanager
+
+import shared.logging as shared_logging
+from shared.logging import LogCategory, LogContext, SupabaseHandler, SupabaseLogWriter, UnifiedLogger
+
+
+class _FakeTable:
+	def __init__(self, inserts, token):
+		self.inserts = inserts
+		self.token = token
+
+	def insert(self, rows):
+		self.inserts.append((self.token, rows))
+		return self
+
+	def execute(self):
+		return None
+
+
+def _patch_use_client(monkeypatch):
+	inserts = []
+
+	class FakeClient:
+		def __init__(self, token):
+			self.token = token
+
+		def table(self, name):
+			return _FakeTable(inserts, self.token)
+
+	@contextmanager
+	def fake_use_client(token=None):
+		yield FakeClient(token)
+
+	monkeypatch.setattr(shared_logging, 'use_client', fake_use_client)
+	return inserts
+
+
+def _record(message, token=None):
+	record = logging.LogRecord('test', logging.INFO, __file__, 1, message, None, None)
+	if token is not None:
+		record.token = token
+	return record
+
+
+def test_supabase_handler_batches_entries_per_token(monkeypatch):
+	inserts = _patch_use_client(monkeypatch)
+	writer = SupabaseLogWriter(flush_interval=0.2)
+	handler = SupabaseHandler(writer)
+
+	handler.emit(_record('first', token='token-a'))
+	handler.emit(_record('second', token='token-a'))
+	handler.emit(_record('third', token='token-b'))
+	handler.flush()
+
+	messages_by_token = {}
+	for token, rows in inserts:
+		messages_by_token.setdefault(token, []).extend(row['message'] for row in rows)
+
+	assert messages_by_token == {'token-a': ['first', 'second'], 'token-b': ['third']}
+	assert len(inserts) == 2
+
+
+def test_supabase_log_writer_drops_oldest_entry_when_queue_is_full(monkeypatch, capsys):
+	_patch_use_client(monkeypatch)
+	writer = SupabaseLogWriter(max_queue_size=1)
+	monkeypatch.setattr(writer, '_ensure_started', lambda: None)
+
+	writer.put(None, {'message': 'dropped'})
+	writer.put(None, {'message': 'kept'})
+
+	assert 'dropping log entry: dropped' in capsys.readouterr().out
+	assert writer._queue.get_nowait() == (None, {'message': 'kept'})
+
+
+def test_unified_logger_skips_disabled_levels(monkeypatch):
+	logger = UnifiedLogger('test-disabled-levels')
+	logger.setLevel(logging.INFO)
+	emitted = []
+	monkeypatch.setattr(logger, 'log', lambda *args, **kwargs: emitted.append((args, kwargs)))
+
+	logger.debug('hidden %s', 'value', context=LogContext(category=LogCategory.UPLOAD))
+	logger.info('shown %s', 'value', context=LogContext(category=LogCategory.UPLOAD, dataset_id=1))
+
+	assert len(emitted) == 1
+	args, kwargs = emitted[0]
+	assert args == (logging.INFO, 'shown %s', 'value')
+	assert kwargs['extra']['dataset_id'] == 1
@@ -6,37 +6,46 @@ from shared.models import StatusEnum
 from shared.status import update_status
 
 
-def test_update_status_refreshes_updated_at(monkeypatch):
-	updates = []
-	inserts = []
+class _Result:
+	def __init__(self, data):
+		self.data = data
 
-	class _ExecuteResult:
-		data = [{'id': 1}]
 
-	class _EqQuery:
-		def __init__(self, payload=None):
-			self.payload = payload
+class _Query:
+	def __init__(self, data):
+		self.data = data
 
-		def eq(self, field, value):
-			assert field == 'dataset_id'
-			assert value == 123
-			return self
+	def eq(self, field, value):
+		assert field == 'dataset_id'
+		assert value == 123
+		return self
+
+	def limit(self, count):
+		return self
 
-		def execute(self):
-			return _ExecuteResult()
+	def execute(self):
+		return _Result(self.data)
+
+
+def _make_status_client(existing_rows, updated_rows, updates, inserts):
+	"""Build a fake supabase client for v2_statuses.
+
+	``existing_rows`` is what the existence check sees, ``updated_rows`` what the
+	UPDATE reports back (empty when RLS filters the row out for this caller).
+	"""
 
 	class _Table:
 		def select(self, fields):
 			assert fields == 'id'
-			return _EqQuery()
+			return _Query(existing_rows)
 
 		def update(self, payload):
 			updates.append(payload)
-			return _EqQuery(payload)
+			return _Query(updated_rows)
 
 		def insert(self, payload):
 			inserts.append(payload)
-			return _EqQuery(payload)
+			return _Query([payload])
 
 	class _Client:
 		def table(self, name):
@@ -49,7 +58,14 @@ def test_update_status_refreshes_updated_at(monkeypatch):
 		def __exit__(self, exc_type, exc, tb):
 			return False
 
-	monkeypatch.setattr('shared.status.use_client', lambda token: _Client())
+	return _Client()
+
+
+def test_update_status_refreshes_updated_at(monkeypatch):
+	updates = []
+	inserts = []
+	client = _make_status_client([{'id': 1}], [{'id': 1}], updates, inserts)
+	monkeypatch.setattr('shared.status.use_client', lambda token: client)
 
 	update_status('token', dataset_id=123, current_status=StatusEnum.ortho_processing)
 
@@ -61,48 +77,14 @@ def test_update_status_refreshes_updated_at(monkeypatch):
 
 
 def test_update_status_sets_updated_at_when_creating_status(monkeypatch):
+	updates = []
 	inserts = []
-
-	class _EmptyResult:
-		data = []
-
-	class _EqQuery:
-		def eq(self, field, value):
-			assert field == 'dataset_id'
-			assert value == 123
-			return self
-
-		def execute(self):
-			return _EmptyResult()
-
-	class _InsertQuery:
-		def execute(self):
-			return None
-
-	class _Table:
-		def select(self, fields):
-			assert fields == 'id'
-			return _EqQuery()
-
-		def insert(self, payload):
-			inserts.append(payload)
-			return _InsertQuery()
-
-	class _Client:
-		def table(self, name):
-			assert name == 'v2_statuses'
-			return _Table()
-
-		def __enter__(self):
-			return self
-
-		def __exit__(self, exc_type, exc, tb):
-			return False
-
-	monkeypatch.setattr('shared.status.use_client', lambda token: _Client())
+	client = _make_status_client([], [], updates, inserts)
+	monkeypatch.setattr('shared.status.use_client', lambda token: client)
 
 	update_status('token', dataset_id=123, is_upload_done=True)
 
+	assert updates == []
 	assert len(inserts) == 1
 	assert inserts[0]['dataset_id'] == 123
 	assert inserts[0]['is_upload_done'] is True
@@ -110,38 +92,17 @@ def test_update_status_sets_updated_at_when_creating_status(monkeypatch):
 	assert updated_at.tzinfo is not None
 
 
-def _make_recording_client(updates):
-	"""Build a fake supabase client that records status updates."""
-
-	class _ExecuteResult:
-		data = [{'id': 1}]
-
-	class _EqQuery:
-		def eq(self, field, value):
-			return self
-
-		def execute(self):
-			return _ExecuteResult()
-
-	class _Table:
-		def select(self, fields):
-			return _EqQuery()
-
-		def update(self, payload):
-			updates.append(payload)
-			return _EqQuery()
-
-	class _Client:
-		def table(self, name):
-			return _Table()
-
-		def __enter__(self):
-			return self
+def test_update_status_does_not_insert_when_rls_filters_the_update(monkeypatch):
+	"""An UPDATE hidden by RLS returns no rows; that must not create a duplicate status row."""
+	updates = []
+	inserts = []
+	client = _make_status_client([{'id': 1}], [], updates, inserts)
+	monkeypatch.setattr('shared.status.use_client', lambda token: client)
 
-		def __exit__(self, exc_type, exc, tb):
-			return False
+	update_status('token', dataset_id=123, is_upload_done=True)
 
-	return _Client()
+	assert len(updates) == 1
+	assert inserts == []
 
 
 def test_update_status_retries_on_transient_error(monkeypatch):
@@ -159,7 +120,7 @@ def test_update_status_retries_on_transient_error(monkeypatch):
 		calls['n'] += 1
 		if calls['n'] < 3:
 			raise Exception('Server disconnected without sending a response.')
-		return _make_recording_client(updates)
+		return _make_status_client([{'id': 1}], [{'id': 1}], updates, [])
 
 	monkeypatch.setattr('shared.status.use_client', fake_use_client)
 
@@ -0,0 +1,75 @@
+-- Create (or reuse) a label's AOI and insert the label row in one round trip.
+-- Geometries are still inserted by the caller in chunks so each statement
+-- stays within the authenticated role's statement_timeout.
+-- security invoker keeps the existing v2_aois / v2_labels RLS policies in force.
+
+create or replace function public.create_label_with_aoi(p_label jsonb, p_aoi jsonb default null)
+returns public.v2_labels
+language plpgsql
+volatile
+security invoker
+set search_path = ''
+as $$
+declare
+    v_aoi_id bigint;
+    v_label public.v2_labels;
+begin
+    if p_aoi is not null then
+        -- Reuse an existing whole-image AOI for the dataset
+        if coalesce((p_aoi ->> 'is_whole_image')::boolean, false) then
+            select aoi.id
+            into v_aoi_id
+            from public.v2_aois aoi
+            where aoi.dataset_id = (p_aoi ->> 'dataset_id')::bigint
+              and aoi.is_whole_image
+            order by aoi.id
+            limit 1;
+        end if;
+
+        if v_aoi_id is null then
+            insert into public.v2_aois (dataset_id, user_id, geometry, is_whole_image, image_quality, notes)
+            select aoi.dataset_id, aoi.user_id, aoi.geometry, aoi.is_whole_image, aoi.image_quality, aoi.notes
+            from jsonb_populate_record(null::public.v2_aois, p_aoi) aoi
+            returning id into v_aoi_id;
+        end if;
+    end if;
+
+    insert into public.v2_labels (
+        dataset_id,
+        aoi_id,
+        user_id,
+        label_source,
+        label_type,
+        label_data,
+        label_quality,
+        model_config,
+        is_active,
+        parent_label_id,
+        reference_patch_id,
+        version
+    )
+    select
+        label.dataset_id,
+        coalesce(v_aoi_id, label.aoi_id),
+        label.user_id,
+        label.label_source,
+        label.label_type,
+        label.label_data,
+        label.label_quality,
+        label.model_config,
+        coalesce(label.is_active, true),
+        label.parent_label_id,
+        label.reference_patch_id,
+        coalesce(label.version, 1)
+    from jsonb_populate_record(null::public.v2_labels, p_label) label
+    returning * into v_label;
+
+    return v_label;
+end;
+$$;
+
+revoke all on function public.create_label_with_aoi(jsonb, jsonb) from public, anon;
+grant execute on function public.create_label_with_aoi(jsonb, jsonb) to authenticated, service_role;
+
+comment on function public.create_label_with_aoi(jsonb, jsonb)
+is 'Creates or reuses the label AOI and inserts the v2_labels row in a single transaction.';
@@ -0,0 +1,46 @@
+-- Delete a dataset's model prediction labels in a single statement instead of
+-- a SELECT followed by a DELETE ... IN (...). Geometries follow via ON DELETE CASCADE.
+-- When p_model_config is given, only labels whose model_config has the same value for
+-- each of its top-level keys are deleted, plus legacy labels without a model_config.
+-- Keys are compared with plain equality like the former Python filter, not jsonb
+-- containment: nested arrays/objects must match exactly, and a null filter value
+-- also matches a label that lacks the key.
+-- security invoker keeps the existing v2_labels RLS policies in force.
+
+create or replace function public.delete_model_prediction_labels(
+    p_dataset_id bigint,
+    p_label_data text,
+    p_model_config jsonb default null
+)
+returns integer
+language sql
+volatile
+security invoker
+set search_path = ''
+as $$
+    with deleted as (
+        delete from public.v2_labels label
+        where label.dataset_id = p_dataset_id
+          and label.label_source = 'model_prediction'
+          and label.label_data = p_label_data::public."LabelData"
+          and (
+              p_model_config is null
+              or label.model_config is null
+              or label.model_config = 'null'::jsonb
+              or not exists (
+                  select 1
+                  from jsonb_each(p_model_config) filter_entry
+                  where coalesce(label.model_config -> filter_entry.key, 'null'::jsonb)
+                      is distinct from filter_entry.value
+              )
+          )
+        returning 1
+    )
+    select count(*)::integer from deleted;
+$$;
+
+revoke all on function public.delete_model_prediction_labels(bigint, text, jsonb) from public, anon;
+grant execute on function public.delete_model_prediction_labels(bigint, text, jsonb) to authenticated, service_role;
+
+comment on function public.delete_model_prediction_labels(bigint, text, jsonb)
+is 'Deletes model prediction labels of one label_data type for a dataset and returns how many were removed.';